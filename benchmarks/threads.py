@@ -0,0 +1,101 @@
+"""
+Throughput of `fmap`/`bind`-heavy pipelines from 1 to N threads
+
+Run on free-threaded CPython (3.13t) to see how pipelines scale without the GIL,
+with the GIL enabled throughput stays flat. `--workload breaker` routes every step
+through one shared `CircuitBreaker` to show contention on shared state
+
+    python benchmarks/threads.py --max-threads 8 --ops 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from typing import Callable
+
+from pyferret.circuit import CircuitBreaker
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err, Ok, Result
+
+
+def half(x: int) -> Result[int, str]:
+    return Ok(x // 2) if x % 7 else Err("seven")
+
+
+def lookup(x: int) -> Maybe[int]:
+    return Just(x) if x % 5 else Nothing()
+
+
+def scale(x: int, factor: int) -> int:
+    return x * factor
+
+
+def pure_pipeline(ops: int) -> None:
+    for i in range(ops):
+        Ok(i).fmap(abs).bind(half).fmap_partial(scale, 3).bind_through(half)
+        Just(i).bind(lookup).fmap(str).fmap(len)
+
+
+def breaker_pipeline(breaker: CircuitBreaker) -> Callable[[int], None]:
+    def run(ops: int) -> None:
+        for i in range(ops):
+            Ok(i).fmap(abs).bind(breaker).fmap_partial(scale, 3)
+            Just(i).bind(lookup).fmap(str).fmap(len)
+
+    return run
+
+
+def measure(work: Callable[[int], None], threads: int, ops: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def target() -> None:
+        barrier.wait()
+        work(ops)
+
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.join()
+
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--workload", choices=["pure", "breaker"], default="pure")
+    args = parser.parse_args()
+
+    if args.workload == "pure":
+        work = pure_pipeline
+    else:
+        work = breaker_pipeline(
+            CircuitBreaker(half, failure_threshold=10**9, window=10**9)
+        )
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    sys.stdout.write(f"{sys.version.split()[0]}, GIL enabled: {gil}\n")
+    sys.stdout.write(f"{'threads':>8} {'ops/s':>14} {'scaling':>8}\n")
+
+    base = 0.0
+
+    for threads in range(1, args.max_threads + 1):
+        throughput = measure(work, threads, args.ops)
+        base = base or throughput
+        sys.stdout.write(
+            f"{threads:>8} {throughput:>14,.0f} {throughput / base:>8.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from .abstract import Applicative, Context, Functor, Monad
-from .helpers import from_optional
+from .helpers import err_many, from_optional, from_optional_many, ok_many
 from .maybe import Just, Maybe, Nothing
 from .result import Err, Ok, Result
+from .step import Step
 
 __all__ = [
     "Just",
@@ -10,9 +11,13 @@ __all__ = [
     "Ok",
     "Err",
     "Result",
+    "Step",
     "Context",
     "Functor",
     "Applicative",
     "Monad",
     "from_optional",
+    "from_optional_many",
+    "ok_many",
+    "err_many",
 ]
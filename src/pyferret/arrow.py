@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from pyferret import helpers, maybe, result
+
+try:
+    import pyarrow as pa
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "pyferret.arrow requires pyarrow, install it with `pip install pyferret[arrow]`"
+    ) from exc
+
+OK_FIELD = "ok"
+ERR_FIELD = "err"
+
+
+def maybe_to_arrow(
+    items: Iterable[maybe.Maybe[Any]], type: pa.DataType | None = None
+) -> pa.Array:
+    """
+    Convert `Maybe` items to Arrow array, `Nothing` is null in validity bitmap
+
+    `Just(None)` is converted to null as well
+    """
+    return pa.array([item._value for item in items], type=type)
+
+
+def maybe_from_arrow(array: pa.Array | pa.ChunkedArray) -> list[maybe.Maybe[Any]]:
+    """
+    Convert Arrow array to `Maybe` items, nulls become `Nothing`
+    """
+    return helpers.from_optional_many(array.to_pylist())
+
+
+def result_to_arrow(
+    items: Iterable[result.Result[Any, Any]], type: pa.DataType | None = None
+) -> pa.StructArray:
+    """
+    Convert `Result` items to Arrow struct array with `ok` values of `type` and `err`
+    strings, only one field of every row is valid
+
+    Err values are converted with `str`
+    """
+    oks: list[Any] = []
+    errs: list[str | None] = []
+    ok_append, err_append = oks.append, errs.append
+
+    for item in items:
+        if isinstance(item, result.Ok):
+            ok_append(item._value)
+            err_append(None)
+        else:
+            ok_append(None)
+            err_append(str(item._value))
+
+    return pa.StructArray.from_arrays(
+        [pa.array(oks, type=type), pa.array(errs, type=pa.string())],
+        names=[OK_FIELD, ERR_FIELD],
+    )
+
+
+def result_from_arrow(
+    array: pa.StructArray | pa.ChunkedArray,
+) -> list[result.Result[Any, str]]:
+    """
+    Convert Arrow struct array made by `result_to_arrow` back to `Result` items,
+    rows with valid `err` field become `Err[str]`
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+
+    return [
+        result.Ok(ok) if err is None else result.Err(err)
+        for ok, err in zip(
+            array.field(OK_FIELD).to_pylist(), array.field(ERR_FIELD).to_pylist()
+        )
+    ]
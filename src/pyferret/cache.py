@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, ParamSpec
+
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+P = ParamSpec("P")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY, entries INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats SELECT 1, count(*) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN UPDATE stats SET entries = entries + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN UPDATE stats SET entries = entries - 1 WHERE id = 1; END;
+"""
+
+
+class DiskCache:
+    """
+    Pickled values stored by `bytes` keys in sqlite database at `path`
+
+    Keeps at most `max_entries`, least recently read entries are evicted first.
+    Entries expire `ttl` seconds after they are set, or never if `ttl` is `None`
+
+    Database uses WAL journal and waits up to `busy_timeout` seconds for locks, so it
+    can be shared by threads and processes on one host. Every thread of every process
+    gets its own connection
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 10_000,
+        ttl: float | None = None,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._local = threading.local()
+        self._counters = threading.Lock()
+
+        self._connect().executescript(SCHEMA)
+
+    def get(self, key: bytes) -> Maybe[Any]:
+        """
+        `Just` stored value, or `Nothing` if it's missing, expired or can't be loaded
+        """
+        conn = self._connect()
+        now = self._clock()
+        row = conn.execute(
+            "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is not None and (row[1] is None or row[1] > now):
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                pass
+            else:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                with self._counters:
+                    self.hits += 1
+
+                return Just(value)
+
+        if row is not None:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+        with self._counters:
+            self.misses += 1
+
+        return Nothing()
+
+    def set(self, key: bytes, value: Any, ttl: float | None = None) -> bool:
+        """
+        Store `value` for `ttl` seconds, or the cache `ttl` if not given
+
+        Returns `False` if `value` can't be pickled
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        ttl = self.ttl if ttl is None else ttl
+        now = self._clock()
+        conn = self._connect()
+
+        with _transaction(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, data, None if ttl is None else now + ttl, now),
+            )
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+            (count,) = conn.execute("SELECT entries FROM stats").fetchone()
+
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+        return True
+
+    def delete(self, key: bytes) -> None:
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT entries FROM stats").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        pid, conn = getattr(self._local, "conn", (None, None))
+
+        # Connection must not be reused by a forked process
+        if conn is None or pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Row replaced by INSERT OR REPLACE fires delete trigger only with it
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = (os.getpid(), conn)
+
+        return conn
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    # Take the write lock up front, so concurrent writers wait for `busy_timeout`
+    # instead of failing on lock upgrade
+    conn.execute("BEGIN IMMEDIATE")
+
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+    conn.execute("COMMIT")
+
+
+def persistent_cache(
+    path: str | Path,
+    *,
+    max_entries: int = 10_000,
+    ttl: float | None = None,
+    cache_err: bool = False,
+    err_ttl: float | None = None,
+    busy_timeout: float = 5.0,
+) -> Callable[[Callable[P, Any]], Callable[P, Any]]:
+    """
+    Memoize `(*args -> Result[T, E] | Maybe[T])`, sync or async, in `DiskCache` at
+    `path`, so results survive process restarts
+
+    `Err` is cached only if `cache_err`, for `err_ttl` seconds or `ttl` if not given.
+    Calls with arguments which can't be pickled are not cached, arguments must pickle
+    the same way for equal values (e.g. no sets of strings)
+
+    Async function reads and writes the store in a worker thread, so waiting for
+    locks held by other processes doesn't block the event loop
+
+    Store is available as `cache` attribute of the decorated function
+    """
+    cache = DiskCache(path, max_entries=max_entries, ttl=ttl, busy_timeout=busy_timeout)
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def store(key: bytes, res: Any) -> None:
+            if isinstance(res, Err):
+                if cache_err:
+                    cache.set(key, res, err_ttl)
+            else:
+                cache.set(key, res)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                key = _key(name, args, kwargs)
+
+                if key is None:
+                    return await func(*args, **kwargs)
+
+                # Store may wait for a lock held by another process, so it's
+                # accessed from a worker thread instead of blocking the event loop
+                cached = await asyncio.to_thread(cache.get, key)
+
+                if isinstance(cached, Just):
+                    return cached.value
+
+                res = await func(*args, **kwargs)
+                await asyncio.to_thread(store, key, res)
+
+                return res
+
+            async_wrapper.cache = cache  # type: ignore[attr-defined]
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            key = _key(name, args, kwargs)
+
+            if key is None:
+                return func(*args, **kwargs)
+
+            cached = cache.get(key)
+
+            if isinstance(cached, Just):
+                return cached.value
+
+            res = func(*args, **kwargs)
+            store(key, res)
+
+            return res
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def _key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes | None:
+    try:
+        data = pickle.dumps(
+            (name, args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL
+        )
+    except Exception:
+        return None
+
+    return hashlib.sha256(data).digest()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generic, Sequence, TypeVar
+
+from pyferret.result import Err, Ok, Result
+
+T = TypeVar("T")
+S = TypeVar("S")
+E = TypeVar("E")
+
+VERSION = 2
+
+
+class BatchProgress:
+    """
+    Counters of a `CheckpointRunner` run, `done` includes items loaded from the
+    checkpoint while `throughput` and `eta` count only items processed by this run
+    """
+
+    def __init__(
+        self,
+        total: int,
+        outcomes: dict[int, Result[Any, Any]],
+        clock: Callable[[], float],
+    ) -> None:
+        self.total = total
+        self.done = len(outcomes)
+        self.errors = sum(isinstance(res, Err) for res in outcomes.values())
+        self.processed = 0
+        self._clock = clock
+        self._started_at = clock()
+
+    def record(self, res: Result[Any, Any]) -> None:
+        self.done += 1
+        self.processed += 1
+        self.errors += isinstance(res, Err)
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self._started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        Items per second processed by this run
+        """
+        elapsed = self.elapsed
+
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Estimated seconds until all items are done, `None` before first item
+        """
+        throughput = self.throughput
+
+        if not throughput:
+            return None
+
+        return (self.total - self.done) / throughput
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "done": self.done,
+            "errors": self.errors,
+            "processed": self.processed,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "eta": self.eta,
+        }
+
+
+class CheckpointRunner(Generic[T, S, E]):
+    """
+    Applies `(T -> Result[S, E])` pipeline to items of a sequence and records their
+    outcomes by index in checkpoint file at `path`
+
+    Checkpoint is a log: new outcomes are appended every `every` items or
+    `every_seconds` seconds, whichever comes first, and when the run ends or raises.
+    Rerun loads it and skips done items, `Err` items are processed again if
+    `retry_errors`. The log is compacted to one record when a run starts, so every
+    outcome is written once per run. Outcomes must be picklable
+
+    `on_checkpoint` is called with `BatchProgress` after every append
+    """
+
+    def __init__(
+        self,
+        pipeline: Callable[[T], Result[S, E]],
+        path: str | Path,
+        *,
+        every: int = 1000,
+        every_seconds: float = 60.0,
+        retry_errors: bool = False,
+        on_checkpoint: Callable[[BatchProgress], Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if every < 1:
+            raise ValueError("every must be positive")
+
+        self.pipeline = pipeline
+        self.path = Path(path)
+        self.every = every
+        self.every_seconds = every_seconds
+        self.retry_errors = retry_errors
+        self.progress: BatchProgress | None = None
+        self._on_checkpoint = on_checkpoint
+        self._clock = clock
+
+    def run(self, items: Sequence[T]) -> list[Result[S, E]]:
+        """
+        Process items not done yet, returns outcomes of all items in order
+        """
+        total = len(items)
+        outcomes = self.load(total)
+
+        if self.retry_errors:
+            outcomes = {i: res for i, res in outcomes.items() if isinstance(res, Ok)}
+
+        self._compact(total, outcomes)
+
+        progress = self.progress = BatchProgress(total, outcomes, self._clock)
+        pending: dict[int, Result[S, E]] = {}
+        saved_at = self._clock()
+
+        with self.path.open("ab") as file:
+            try:
+                for i, item in enumerate(items):
+                    if i in outcomes:
+                        continue
+
+                    res = outcomes[i] = pending[i] = self.pipeline(item)
+                    progress.record(res)
+
+                    if (
+                        len(pending) >= self.every
+                        or self._clock() - saved_at >= self.every_seconds
+                    ):
+                        self._append(file, pending)
+                        pending, saved_at = {}, self._clock()
+            finally:
+                self._append(file, pending)
+
+        return [outcomes[i] for i in range(total)]
+
+    def load(self, total: int) -> dict[int, Result[S, E]]:
+        """
+        Outcomes by index from checkpoint, empty if there's no checkpoint yet
+
+        Raises `ValueError` if checkpoint has another format version or was written for
+        a different number of items
+        """
+        try:
+            file = self.path.open("rb")
+        except FileNotFoundError:
+            return {}
+
+        outcomes: dict[int, Result[S, E]] = {}
+
+        with file:
+            header = pickle.load(file)
+
+            if header.get("version") != VERSION:
+                raise ValueError(
+                    f"Checkpoint {str(self.path)!r} has format version"
+                    f" {header.get('version')}, expected {VERSION}"
+                )
+
+            if header["total"] != total:
+                raise ValueError(
+                    f"Checkpoint {str(self.path)!r} was written for"
+                    f" {header['total']} items, got {total}"
+                )
+
+            while True:
+                try:
+                    outcomes.update(pickle.load(file))
+                except EOFError:
+                    break
+                except Exception:
+                    # Record torn by a crash while appending, it's dropped by compaction
+                    break
+
+        return outcomes
+
+    def reset(self) -> None:
+        """
+        Remove checkpoint file, next run processes all items
+        """
+        self.path.unlink(missing_ok=True)
+
+    def _compact(self, total: int, outcomes: dict[int, Result[S, E]]) -> None:
+        """
+        Atomically replace the log with header and all `outcomes` in one record
+        """
+        fd, name = tempfile.mkstemp(dir=self.path.parent, prefix=".checkpoint-")
+        tmp = Path(name)
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(
+                    {"version": VERSION, "total": total},
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+                if outcomes:
+                    pickle.dump(outcomes, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink()
+            raise
+
+    def _append(self, file: BinaryIO, outcomes: dict[int, Result[S, E]]) -> None:
+        if outcomes:
+            pickle.dump(outcomes, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+
+        if self._on_checkpoint is not None and self.progress is not None:
+            self._on_checkpoint(self.progress)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Generic, Literal, ParamSpec, TypeAlias, TypeVar
+
+from pyferret.result import Err, Ok, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+P = ParamSpec("P")
+
+State: TypeAlias = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """
+    Error returned by an open circuit breaker instead of calling the dependency
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.name = name
+
+    def __str__(self) -> str:
+        return f"Circuit {self.name!r} is open"
+
+
+class CircuitBreaker(Generic[P, T, E]):
+    """
+    Wraps `(*args -> Result[T, E])`, sync or async, and counts `Err` outcomes over a
+    sliding window of last `window` calls
+
+    When `failure_threshold` errors are in the window the circuit opens and every call
+    returns the same `Err[CircuitOpenError]` without calling the dependency. After
+    `recovery_timeout` seconds up to `half_open_probes` calls are let through, first
+    `Ok` closes the circuit and first `Err` opens it again
+
+    Exceptions raised by the wrapped function are counted as failures and re-raised.
+    `BaseException`s like `CancelledError` and `KeyboardInterrupt` are re-raised
+    without recording an outcome, a probe slot taken by the call is released
+    """
+
+    def __init__(
+        self,
+        func: Callable[P, Any],
+        *,
+        failure_threshold: int = 5,
+        window: int = 20,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        name: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_threshold <= window:
+            raise ValueError("failure_threshold must be in range 1..window")
+
+        self.name: str = (
+            name if name is not None else getattr(func, "__qualname__", repr(func))
+        )
+        self._func = func
+        self._is_async = inspect.iscoroutinefunction(func)
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rejection: Err[CircuitOpenError] = Err(CircuitOpenError(self.name))
+
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._window_failures = 0
+        self._state: State = "closed"
+        self._opened_at = 0.0
+        self._probes = 0
+
+        self._calls = 0
+        self._successes = 0
+        self._failures = 0
+        self._rejections = 0
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        if self._is_async:
+            return self._call_async(*args, **kwargs)
+
+        is_probe = self._acquire()
+
+        if is_probe is None:
+            return self._rejection
+
+        try:
+            res = self._func(*args, **kwargs)
+        except Exception:
+            self._record(False, is_probe)
+            raise
+        except BaseException:
+            self._release(is_probe)
+            raise
+
+        self._record(isinstance(res, Ok), is_probe)
+
+        return res
+
+    async def _call_async(self, *args: Any, **kwargs: Any) -> Result[T, Any]:
+        is_probe = self._acquire()
+
+        if is_probe is None:
+            return self._rejection
+
+        try:
+            res = await self._func(*args, **kwargs)
+        except Exception:
+            self._record(False, is_probe)
+            raise
+        except BaseException:
+            self._release(is_probe)
+            raise
+
+        self._record(isinstance(res, Ok), is_probe)
+
+        return res
+
+    @property
+    def state(self) -> State:
+        """
+        Current state, an expired open circuit is reported as `half_open`
+        """
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    @property
+    def calls(self) -> int:
+        """
+        Number of calls passed to the wrapped function
+        """
+        return self._calls
+
+    @property
+    def successes(self) -> int:
+        """
+        Number of calls returned `Ok`
+        """
+        return self._successes
+
+    @property
+    def failures(self) -> int:
+        """
+        Number of calls returned `Err` or raised an `Exception`
+        """
+        return self._failures
+
+    @property
+    def rejections(self) -> int:
+        """
+        Number of calls short-circuited with `Err[CircuitOpenError]`
+        """
+        return self._rejections
+
+    @property
+    def window_failures(self) -> int:
+        """
+        Number of failures in the current sliding window
+        """
+        return self._window_failures
+
+    def reset(self) -> None:
+        """
+        Close the circuit and forget the sliding window, counters are preserved
+        """
+        with self._lock:
+            self._close()
+
+    def _acquire(self) -> bool | None:
+        """
+        Returns `None` if the call is rejected, otherwise whether call is a probe
+        """
+        with self._lock:
+            if self._state == "closed":
+                return False
+
+            self._refresh()
+
+            if self._state == "half_open" and self._probes < self._half_open_probes:
+                self._probes += 1
+                return True
+
+            self._rejections += 1
+            return None
+
+    def _record(self, ok: bool, is_probe: bool) -> None:
+        with self._lock:
+            self._calls += 1
+
+            if ok:
+                self._successes += 1
+            else:
+                self._failures += 1
+
+            if is_probe:
+                self._probes -= 1
+
+                if ok:
+                    self._close()
+                else:
+                    self._open()
+
+            elif self._state == "closed":
+                outcomes = self._outcomes
+
+                if len(outcomes) == outcomes.maxlen and not outcomes[0]:
+                    self._window_failures -= 1
+
+                outcomes.append(ok)
+
+                if not ok:
+                    self._window_failures += 1
+
+                    if self._window_failures >= self._failure_threshold:
+                        self._open()
+
+    def _release(self, is_probe: bool) -> None:
+        if is_probe:
+            with self._lock:
+                self._probes -= 1
+
+    def _refresh(self) -> None:
+        if (
+            self._state == "open"
+            and self._clock() - self._opened_at >= self._recovery_timeout
+        ):
+            self._state = "half_open"
+            self._probes = 0
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = self._clock()
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._outcomes.clear()
+        self._window_failures = 0
+        self._probes = 0
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker {self.name!r} {self.state}"
+
+
+def circuit_breaker(
+    *,
+    failure_threshold: int = 5,
+    window: int = 20,
+    recovery_timeout: float = 30.0,
+    half_open_probes: int = 1,
+    name: str | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[Callable[P, Any]], CircuitBreaker[P, Any, Any]]:
+    """
+    Decorator form of `CircuitBreaker`
+    """
+
+    def decorator(func: Callable[P, Any]) -> CircuitBreaker[P, Any, Any]:
+        return CircuitBreaker(
+            func,
+            failure_threshold=failure_threshold,
+            window=window,
+            recovery_timeout=recovery_timeout,
+            half_open_probes=half_open_probes,
+            name=name,
+            clock=clock,
+        )
+
+    return decorator
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable
+
+from pyferret.result import Err, Ok, Result
+
+
+class SharedResultBatch:
+    """
+    Fixed-size batch of `Result` stored as columns in shared memory: ok values of one
+    `array` typecode and a byte per row error mask
+
+    Batch is passed to worker processes by name (pickling doesn't copy data), workers
+    write rows in place. Err payloads are kept in a process-local side channel, worker
+    returns `take_errors()` and parent applies it with `merge_errors()`. A byte per row
+    is used instead of a bitmap so workers filling neighbouring rows never race
+    """
+
+    def __init__(
+        self,
+        size: int,
+        typecode: str = "d",
+        *,
+        _shm: shared_memory.SharedMemory | None = None,
+    ) -> None:
+        itemsize = array(typecode).itemsize
+        offset = -(-size // itemsize) * itemsize
+
+        if _shm is None:
+            _shm = shared_memory.SharedMemory(
+                create=True, size=max(offset + size * itemsize, 1)
+            )
+            self._owner = True
+        else:
+            self._owner = False
+
+        self.size = size
+        self.typecode = typecode
+        self.errors: dict[int, Any] = {}
+        self._shm = _shm
+
+        buf = _shm.buf
+        assert buf is not None
+        self.err_mask: memoryview = buf[:size]
+        self.ok_values: memoryview = buf[offset : offset + size * itemsize].cast(
+            typecode  # type: ignore[call-overload]
+        )
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Result[Any, Any]], typecode: str = "d"
+    ) -> SharedResultBatch:
+        items = list(results)
+        batch = cls(len(items), typecode)
+        batch.fill(0, items)
+
+        return batch
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def set_ok(self, index: int, value: Any) -> None:
+        self.ok_values[index] = value
+        self.err_mask[index] = 0
+        self.errors.pop(index, None)
+
+    def set_err(self, index: int, error: Any) -> None:
+        self.err_mask[index] = 1
+        self.errors[index] = error
+
+    def fill(self, start: int, results: Iterable[Result[Any, Any]]) -> None:
+        """
+        Write results to rows starting from `start`
+        """
+        for index, res in enumerate(results, start):
+            if isinstance(res, Ok):
+                self.set_ok(index, res._value)
+            else:
+                self.set_err(index, res._value)
+
+    def is_err(self, index: int) -> bool:
+        return bool(self.err_mask[index])
+
+    def get(self, index: int) -> Result[Any, Any]:
+        if self.err_mask[index]:
+            return Err(self.errors.get(index))
+
+        return Ok(self.ok_values[index])
+
+    def take_errors(self) -> dict[int, Any]:
+        """
+        Return and forget err payloads written in this process
+        """
+        errors, self.errors = self.errors, {}
+
+        return errors
+
+    def merge_errors(self, errors: dict[int, Any]) -> None:
+        self.errors.update(errors)
+
+    def results(self) -> list[Result[Any, Any]]:
+        """
+        Materialize rows as `Ok`/`Err`, rows marked as errors without a merged payload
+        are `Err[None]`
+        """
+        errors = self.errors
+
+        return [
+            Err(errors.get(index)) if is_err else Ok(value)
+            for index, (is_err, value) in enumerate(
+                zip(self.err_mask.tolist(), self.ok_values.tolist())
+            )
+        ]
+
+    def close(self) -> None:
+        """
+        Release this process view of the batch
+        """
+        self.err_mask.release()
+        self.ok_values.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Free shared memory, should be called once by the creator
+        """
+        self._shm.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _attach, (self.name, self.size, self.typecode, _tracker_id())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> SharedResultBatch:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self) -> str:
+        return f"SharedResultBatch {self.name!r} size={self.size} {self.typecode!r}"
+
+
+def _attach(
+    name: str, size: int, typecode: str, tracker: tuple[int, int] | None
+) -> SharedResultBatch:
+    shm = shared_memory.SharedMemory(name=name)
+
+    # Processes started by multiprocessing share the creator's resource tracker, which
+    # keeps the segment registered until the creator unlinks it. A process with its
+    # own tracker must forget the segment, otherwise the tracker would unlink it when
+    # this process exits
+    if os.name == "posix" and _tracker_id() != tracker:
+        tracked = shm._name  # type: ignore[attr-defined]
+        resource_tracker.unregister(tracked, "shared_memory")
+
+    return SharedResultBatch(size, typecode, _shm=shm)
+
+
+def _tracker_id() -> tuple[int, int] | None:
+    """
+    Identity of the pipe to this process resource tracker, same for all processes
+    sharing the tracker
+    """
+    if os.name != "posix":
+        return None
+
+    fd = resource_tracker.getfd()
+    assert fd is not None
+    stat = os.fstat(fd)
+
+    return stat.st_dev, stat.st_ino
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Protocol, Sequence, TypeVar
+
+from pyferret.result import Err, Ok, Result
+
+Row = TypeVar("Row", bound=Sequence[Any] | dict[str, Any])
+
+
+class Connection(Protocol):
+    """
+    Part of DB-API 2.0 connection used by `write_many`
+    """
+
+    def cursor(self) -> Any:
+        ...
+
+    def commit(self) -> Any:
+        ...
+
+    def rollback(self) -> Any:
+        ...
+
+
+def write_many(
+    conn: Connection,
+    sql: str,
+    rows: Sequence[Row],
+    *,
+    chunk_size: int = 1000,
+    errors: tuple[type[Exception], ...] | None = None,
+) -> list[Result[Row, Exception]]:
+    """
+    Run `executemany(sql, chunk)` and commit for every chunk of `rows`, returns
+    `Ok[row]` or `Err[exc]` for every row in its position
+
+    Chunk failed with one of `errors` is rolled back and split in halves until failing
+    rows are found, so good rows are still written in large batches. By default only
+    row-level `IntegrityError` and `DataError` of the connection (DB-API extension
+    attributes) are isolated. Other exceptions (e.g. lost connection or locked
+    database) are re-raised after rollback
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    if errors is None:
+        errors = _row_errors(conn)
+
+    results: list[Result[Row, Exception]] = []
+    cursor = conn.cursor()
+
+    try:
+        for start in range(0, len(rows), chunk_size):
+            results += _write_chunk(
+                conn, cursor, sql, rows[start : start + chunk_size], errors
+            )
+    finally:
+        cursor.close()
+
+    return results
+
+
+def _write_chunk(
+    conn: Connection,
+    cursor: Any,
+    sql: str,
+    rows: Sequence[Row],
+    errors: tuple[type[Exception], ...],
+) -> list[Result[Row, Exception]]:
+    try:
+        cursor.executemany(sql, rows)
+        conn.commit()
+    except errors as exc:
+        conn.rollback()
+
+        if len(rows) == 1:
+            return [Err(exc)]
+
+        middle = len(rows) // 2
+
+        return _write_chunk(conn, cursor, sql, rows[:middle], errors) + _write_chunk(
+            conn, cursor, sql, rows[middle:], errors
+        )
+    except BaseException:
+        conn.rollback()
+        raise
+
+    return [Ok(row) for row in rows]
+
+
+def _row_errors(conn: Connection) -> tuple[type[Exception], ...]:
+    try:
+        return conn.IntegrityError, conn.DataError  # type: ignore[attr-defined]
+    except AttributeError:
+        raise TypeError(
+            "Connection doesn't expose DB-API exceptions, pass `errors` explicitly"
+        ) from None
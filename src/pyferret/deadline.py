@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, ParamSpec
+
+from pyferret.result import Err, Result
+
+P = ParamSpec("P")
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "pyferret_deadline", default=None
+)
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    Error returned when the current deadline is spent before a step is started
+    """
+
+    def __str__(self) -> str:
+        return "Deadline exceeded"
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Set deadline `seconds` from now for the current context, nested deadline can only
+    shorten an outer one
+
+    Deadline is visible to `guarded` steps and `with_timeout` calls in this context,
+    asyncio tasks created from it and threads started by `with_timeout`
+    """
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+
+    token = _deadline.set(at if outer is None else min(at, outer))
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """
+    Seconds left until the current deadline, `None` if there's no deadline
+    """
+    at = _deadline.get()
+
+    if at is None:
+        return None
+
+    return max(at - time.monotonic(), 0.0)
+
+
+def guarded(func: Callable[P, Any]) -> Callable[P, Any]:
+    """
+    Decorate `(*args -> Result[T, E])` step, sync or async, to return
+    `Err[DeadlineExceededError]` without calling it when the current deadline is spent
+
+    Async step is also cancelled when the deadline passes while it runs
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            left = remaining()
+
+            if left is None:
+                return await func(*args, **kwargs)
+
+            if not left:
+                return Err(DeadlineExceededError())
+
+            try:
+                return await asyncio.wait_for(func(*args, **kwargs), left)
+            except TimeoutError:
+                return Err(DeadlineExceededError())
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        if remaining() == 0.0:
+            return Err(DeadlineExceededError())
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def with_timeout(func: Callable[P, Any], seconds: float | None = None) -> Any:
+    """
+    Wrap `(*args -> Result[T, E])`, sync or async, to return `Err[TimeoutError]` if it
+    doesn't complete in `seconds` or before the current deadline, whichever is sooner
+
+    Sync function runs in a daemon thread which is abandoned on timeout
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            timeout = _timeout(seconds)
+
+            if timeout == 0.0:
+                return Err(TimeoutError())
+
+            try:
+                return await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except TimeoutError as exc:
+                return Err(exc)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timeout = _timeout(seconds)
+
+        if timeout == 0.0:
+            return Err(TimeoutError())
+
+        future: Future[Result[Any, Any]] = Future()
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            try:
+                future.set_result(context.run(func, *args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, daemon=True).start()
+
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            return Err(TimeoutError())
+
+    return wrapper
+
+
+def _timeout(seconds: float | None) -> float | None:
+    left = remaining()
+
+    if left is None:
+        return seconds
+
+    if seconds is None:
+        return left
+
+    return min(seconds, left)
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from pyferret import maybe, result
+
+if TYPE_CHECKING:
+    from pyferret.step import Step
+
+CONTEXTS: tuple[type, ...] = (maybe.Just, maybe.Nothing, result.Ok, result.Err)
+
+# Methods which take a user function as first argument
+STEPS = (
+    "fmap",
+    "fmap_through",
+    "fmap_partial",
+    "fmap_partial_through",
+    "bind",
+    "bind_through",
+    "bind_partial",
+    "bind_partial_through",
+    "bind_result",
+    "bind_maybe",
+    "map_err",
+    "bind_err",
+    "or_else",
+    "recover",
+)
+
+# Methods which take a `Step` as first argument
+STEP_CALLS = ("fmap_step", "bind_step")
+
+_tracing = threading.Lock()
+
+
+class StepStats:
+    """
+    Allocations of one user function passed to context methods
+    """
+
+    __slots__ = ("name", "calls", "allocated", "peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.allocated = 0
+        self.peak = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "function": self.name,
+            "calls": self.calls,
+            "allocated": self.allocated,
+            "peak": self.peak,
+        }
+
+
+class AllocationReport:
+    """
+    Result of `trace_allocations`
+
+    `created` counts instances of every context class, `steps` keeps bytes retained
+    after calls (`allocated`) and largest single call peak (`peak`) of every function.
+    Step called inside another step is counted in the outer `peak`, but not in its
+    `allocated`
+    """
+
+    def __init__(self) -> None:
+        self.created: Counter[str] = Counter()
+        self.steps: dict[str, StepStats] = {}
+        self.total_allocated = 0
+
+    def sorted_steps(self) -> list[StepStats]:
+        """
+        Steps sorted by allocated bytes, largest first
+        """
+        return sorted(
+            self.steps.values(), key=lambda s: (s.allocated, s.peak), reverse=True
+        )
+
+    def table(self) -> str:
+        """
+        Render created contexts and steps sorted by allocated bytes as text table
+        """
+        lines = [f"{'context':<10} {'created':>10}"]
+        lines += [
+            f"{cls.__name__:<10} {self.created[cls.__name__]:>10}" for cls in CONTEXTS
+        ]
+        lines.append("")
+        lines.append(f"{'function':<50} {'calls':>10} {'allocated':>12} {'peak':>12}")
+        lines += [
+            f"{s.name[:50]:<50} {s.calls:>10} {s.allocated:>12} {s.peak:>12}"
+            for s in self.sorted_steps()
+        ]
+
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "created": {cls.__name__: self.created[cls.__name__] for cls in CONTEXTS},
+            "total_allocated": self.total_allocated,
+            "steps": [s.to_dict() for s in self.sorted_steps()],
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def _step(self, func: Callable[..., Any]) -> StepStats:
+        name = _function_name(func)
+        stats = self.steps.get(name)
+
+        if stats is None:
+            stats = self.steps[name] = StepStats(name)
+
+        return stats
+
+
+@contextmanager
+def trace_allocations() -> Iterator[AllocationReport]:
+    """
+    Count created `Just`/`Nothing`/`Ok`/`Err` instances and measure bytes allocated
+    by every function or `Step` passed to context methods inside the block
+
+    Context classes are patched while the block runs, so it affects all threads and
+    only one trace can be active at a time. Starts `tracemalloc` if it's not started
+
+    `tracemalloc` counters are process-wide, numbers are exact only if steps run in
+    one thread at a time, otherwise concurrent steps are counted in each other
+    """
+    if not _tracing.acquire(blocking=False):
+        raise RuntimeError("Allocation tracing is already active")
+
+    report = AllocationReport()
+    lock = threading.Lock()
+    local = threading.local()
+    started = not tracemalloc.is_tracing()
+    patched: list[tuple[type, str, Any]] = []
+
+    if started:
+        tracemalloc.start()
+
+    try:
+        for cls in CONTEXTS:
+            patched.append((cls, "__init__", cls.__dict__.get("__init__")))
+            cls.__init__ = _counting_init(cls, report, lock)  # type: ignore[misc]
+
+            for name in STEPS + STEP_CALLS:
+                if name in cls.__dict__:
+                    method = cls.__dict__[name]
+                    patched.append((cls, name, method))
+                    measuring = (
+                        _measuring_step_call if name in STEP_CALLS else _measuring_step
+                    )
+                    setattr(cls, name, measuring(method, report, lock, local))
+
+        before = tracemalloc.get_traced_memory()[0]
+        yield report
+        report.total_allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        for cls, name, original in reversed(patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+        if started:
+            tracemalloc.stop()
+
+        _tracing.release()
+
+
+def _counting_init(
+    cls: type, report: AllocationReport, lock: threading.Lock
+) -> Callable[..., None]:
+    init: Callable[..., None] = getattr(cls, "__init__")
+    name = cls.__name__
+
+    @functools.wraps(init)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+
+        with lock:
+            report.created[name] += 1
+
+    return wrapper
+
+
+def _measuring_step(
+    method: Callable[..., Any],
+    report: AllocationReport,
+    lock: threading.Lock,
+    local: threading.local,
+) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: Any, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        measured = _measured(func, func, report, lock, local)
+
+        return method(self, measured, *args, **kwargs)
+
+    return wrapper
+
+
+def _measuring_step_call(
+    method: Callable[..., Any],
+    report: AllocationReport,
+    lock: threading.Lock,
+    local: threading.local,
+) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: Any, step: Step[Any, Any]) -> Any:
+        # Methods call `step.call` directly, stats are named after the bound function
+        measured = _measured(step.call, step.func, report, lock, local)
+
+        return method(self, _MeasuredStep(measured))
+
+    return wrapper
+
+
+class _MeasuredStep:
+    __slots__ = ("call",)
+
+    def __init__(self, call: Callable[[Any], Any]) -> None:
+        self.call = call
+
+
+def _measured(
+    func: Callable[..., Any],
+    named: Callable[..., Any],
+    report: AllocationReport,
+    lock: threading.Lock,
+    local: threading.local,
+) -> Callable[..., Any]:
+    def measured(*f_args: Any, **f_kwargs: Any) -> Any:
+        # Frames of running steps: [before, highest peak seen, nested allocated]
+        stack: list[list[int]] = local.__dict__.setdefault("stack", [])
+        before, peak = tracemalloc.get_traced_memory()
+
+        if stack:
+            # Peak is reset below, keep the outer step peak before it's lost
+            stack[-1][1] = max(stack[-1][1], peak)
+
+        tracemalloc.reset_peak()
+        frame = [before, before, 0]
+        stack.append(frame)
+
+        try:
+            res = func(*f_args, **f_kwargs)
+        finally:
+            stack.pop()
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(frame[1], peak)
+
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+                stack[-1][2] += current - before
+
+            with lock:
+                stats = report._step(named)
+                stats.calls += 1
+                stats.allocated += current - before - frame[2]
+                stats.peak = max(stats.peak, peak - before)
+
+        return res
+
+    return measured
+
+
+def _function_name(func: Callable[..., Any]) -> str:
+    name = getattr(func, "__qualname__", None) or repr(func)
+    module = getattr(func, "__module__", None)
+
+    return f"{module}.{name}" if module else name
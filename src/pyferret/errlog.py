@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, ParamSpec, TypeVar
+
+from pyferret.result import Err, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+P = ParamSpec("P")
+
+
+class _LazyMessage:
+    """
+    Message rendered only when a handler formats the record
+    """
+
+    __slots__ = ("error", "source")
+
+    def __init__(self, error: Any, source: str | None) -> None:
+        self.error = error
+        self.source = source
+
+    def __str__(self) -> str:
+        error = self.error
+
+        if isinstance(error, BaseException):
+            text = f"{error.__class__.__name__}: {error}"
+        else:
+            text = repr(error)
+
+        if self.source is None:
+            return f"Err {text}"
+
+        return f"Err from {self.source}: {text}"
+
+
+class ErrLogger:
+    """
+    Logs `Err` values as structured records, sampled with `sample_rate` and limited
+    to `rate_limit` records per second with bursts up to `burst`
+
+    Record message is formatted lazily, structured fields are passed with `extra`:
+    `err_type`, `err_value` and `err_source`. If `include_traceback` exception
+    errors are logged with their traceback
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | str = "pyferret",
+        *,
+        level: int = logging.WARNING,
+        sample_rate: float = 1.0,
+        rate_limit: float | None = None,
+        burst: int | None = None,
+        include_traceback: bool = False,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in range 0..1")
+
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(int(rate_limit or 1), 1)
+        self.include_traceback = include_traceback
+        self.emitted = 0
+        self.dropped = 0
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = clock()
+
+    def log(self, res: Result[Any, Any], source: str | None = None) -> bool:
+        """
+        Log `res` if it's `Err` and passes sampling and rate limit, returns whether
+        the record was emitted
+        """
+        if not isinstance(res, Err) or not self.logger.isEnabledFor(self.level):
+            return False
+
+        if not self._admit():
+            return False
+
+        error = res._value
+        exc_info = None
+
+        if self.include_traceback and isinstance(error, BaseException):
+            exc_info = (error.__class__, error, error.__traceback__)
+
+        self.logger.log(
+            self.level,
+            "%s",
+            _LazyMessage(error, source),
+            exc_info=exc_info,
+            extra={
+                "err_type": error.__class__.__name__,
+                "err_value": error,
+                "err_source": source,
+            },
+        )
+
+        return True
+
+    def log_errs(
+        self, results: Iterable[Result[T, E]], source: str | None = None
+    ) -> Iterator[Result[T, E]]:
+        """
+        Yield results unchanged while logging `Err` ones
+        """
+        log = self.log
+
+        for res in results:
+            if isinstance(res, Err):
+                log(res, source)
+
+            yield res
+
+    def wrap(self, func: Callable[P, Any]) -> Callable[P, Any]:
+        """
+        Decorate `(*args -> Result[T, E])`, sync or async, to log returned `Err` with
+        function name as source
+        """
+        source = f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                res = await func(*args, **kwargs)
+
+                if isinstance(res, Err):
+                    self.log(res, source)
+
+                return res
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            res = func(*args, **kwargs)
+
+            if isinstance(res, Err):
+                self.log(res, source)
+
+            return res
+
+        return wrapper
+
+    def _admit(self) -> bool:
+        with self._lock:
+            if self.sample_rate < 1.0 and self._random.random() >= self.sample_rate:
+                self.dropped += 1
+                return False
+
+            if self.rate_limit is not None:
+                now = self._clock()
+                self._tokens = min(
+                    self._tokens + (now - self._refilled_at) * self.rate_limit,
+                    self.burst,
+                )
+                self._refilled_at = now
+
+                if self._tokens < 1.0:
+                    self.dropped += 1
+                    return False
+
+                self._tokens -= 1.0
+
+            self.emitted += 1
+            return True
+
+
+def log_errs(
+    results: Iterable[Result[T, E]],
+    logger: logging.Logger | str = "pyferret",
+    *,
+    source: str | None = None,
+    level: int = logging.WARNING,
+    sample_rate: float = 1.0,
+    rate_limit: float | None = None,
+) -> Iterator[Result[T, E]]:
+    """
+    Yield results unchanged while logging `Err` ones with a new `ErrLogger`
+    """
+    err_logger = ErrLogger(
+        logger, level=level, sample_rate=sample_rate, rate_limit=rate_limit
+    )
+
+    return err_logger.log_errs(results, source)
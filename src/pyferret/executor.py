@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    TypeVar,
+)
+
+from pyferret.result import Err, Ok, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+
+class OverloadedError(Exception):
+    """
+    Error returned to a producer when executor has no free slot for the task
+    """
+
+    def __init__(self, key: Hashable | None = None) -> None:
+        super().__init__(key)
+        self.key = key
+
+    def __str__(self) -> str:
+        if self.key is None:
+            return "Executor is overloaded"
+
+        return f"Executor is overloaded for key {self.key!r}"
+
+
+class _Limits:
+    """
+    Bookkeeping shared by sync and async executors
+
+    Global slot is taken on submit and released when the consumer takes the result,
+    so completed results waiting for the consumer also count against `max_in_flight`
+    Key slot is taken on submit and released when the task completes
+    """
+
+    def __init__(self, max_in_flight: int, max_per_key: int | None) -> None:
+        if max_in_flight < 1 or (max_per_key is not None and max_per_key < 1):
+            raise ValueError("Concurrency limits must be positive")
+
+        self.max_in_flight = max_in_flight
+        self.max_per_key = max_per_key
+        self.in_flight = 0
+        self.running: defaultdict[Hashable, int] = defaultdict(int)
+        self.closed = False
+
+    def has_slot(self, key: Hashable | None) -> bool:
+        return self.in_flight < self.max_in_flight and (
+            key is None
+            or self.max_per_key is None
+            or self.running.get(key, 0) < self.max_per_key
+        )
+
+    def take(self, key: Hashable | None) -> None:
+        self.in_flight += 1
+
+        if key is not None:
+            self.running[key] += 1
+
+    def complete(self, key: Hashable | None) -> None:
+        if key is not None:
+            self.running[key] -= 1
+
+            if not self.running[key]:
+                del self.running[key]
+
+    def rejection(self, key: Hashable | None) -> Err[OverloadedError]:
+        if self.in_flight >= self.max_in_flight:
+            return Err(OverloadedError())
+
+        return Err(OverloadedError(key))
+
+
+class BoundedExecutor(Generic[T, E]):
+    """
+    Runs `(() -> Result[T, E])` tasks in threads with at most `max_in_flight` tasks
+    submitted and not yet consumed, and at most `max_per_key` tasks running per key
+
+    When limits are reached `submit` blocks (up to `timeout`) if `block`, otherwise
+    returns `Err[OverloadedError]` at once. Results are streamed by `results` in
+    completion order, a raised exception is delivered as `Err[Exception]`
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        *,
+        max_per_key: int | None = None,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        self._limits = _Limits(max_in_flight, max_per_key)
+        self._block = block
+        self._timeout = timeout
+        self._cond = threading.Condition()
+        self._done: queue.SimpleQueue[Result[T, Any]] = queue.SimpleQueue()
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight)
+
+    def submit(
+        self, task: Callable[[], Result[T, E]], *, key: Hashable | None = None
+    ) -> Result[None, OverloadedError]:
+        """
+        Schedule `task`, returns `Ok[None]` or `Err[OverloadedError]` if rejected
+        """
+        limits = self._limits
+
+        with self._cond:
+            if limits.closed:
+                raise RuntimeError("Attempt to submit to closed executor")
+
+            if not limits.has_slot(key) and not (
+                self._block
+                and self._cond.wait_for(lambda: limits.has_slot(key), self._timeout)
+            ):
+                return limits.rejection(key)
+
+            limits.take(key)
+
+        self._pool.submit(self._run, task, key)
+
+        return Ok(None)
+
+    def results(self) -> Iterator[Result[T, Any]]:
+        """
+        Yield results as tasks complete, stops when executor is closed and drained
+        """
+        limits = self._limits
+
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: limits.in_flight > 0 or limits.closed)
+
+                if not limits.in_flight:
+                    return
+
+            res = self._done.get()
+
+            with self._cond:
+                limits.in_flight -= 1
+                self._cond.notify_all()
+
+            yield res
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of submitted tasks which results are not consumed yet
+        """
+        return self._limits.in_flight
+
+    def close(self) -> None:
+        """
+        Stop accepting tasks, `results` ends after remaining results are consumed
+        """
+        with self._cond:
+            self._limits.closed = True
+            self._cond.notify_all()
+
+        self._pool.shutdown(wait=False)
+
+    def _run(self, task: Callable[[], Result[T, E]], key: Hashable | None) -> None:
+        try:
+            res: Result[T, Any] = task()
+        except Exception as exc:
+            res = Err(exc)
+
+        with self._cond:
+            self._limits.complete(key)
+            self._cond.notify_all()
+
+        self._done.put(res)
+
+    def __enter__(self) -> BoundedExecutor[T, E]:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncBoundedExecutor(Generic[T, E]):
+    """
+    Asyncio flavour of `BoundedExecutor` for `(() -> Awaitable[Result[T, E]])` tasks
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        *,
+        max_per_key: int | None = None,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        self._limits = _Limits(max_in_flight, max_per_key)
+        self._block = block
+        self._timeout = timeout
+        self._cond = asyncio.Condition()
+        self._done: asyncio.Queue[Result[T, Any]] = asyncio.Queue()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self,
+        task: Callable[[], Awaitable[Result[T, E]]],
+        *,
+        key: Hashable | None = None,
+    ) -> Result[None, OverloadedError]:
+        """
+        Schedule `task`, returns `Ok[None]` or `Err[OverloadedError]` if rejected
+        """
+        limits = self._limits
+
+        async with self._cond:
+            if limits.closed:
+                raise RuntimeError("Attempt to submit to closed executor")
+
+            if not limits.has_slot(key):
+                if not self._block:
+                    return limits.rejection(key)
+
+                try:
+                    await asyncio.wait_for(
+                        self._cond.wait_for(lambda: limits.has_slot(key)),
+                        self._timeout,
+                    )
+                except asyncio.TimeoutError:
+                    return limits.rejection(key)
+
+            limits.take(key)
+
+        running = asyncio.create_task(self._run(task, key))
+        self._tasks.add(running)
+        running.add_done_callback(self._tasks.discard)
+
+        return Ok(None)
+
+    async def results(self) -> AsyncIterator[Result[T, Any]]:
+        """
+        Yield results as tasks complete, stops when executor is closed and drained
+        """
+        limits = self._limits
+
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(lambda: limits.in_flight > 0 or limits.closed)
+
+                if not limits.in_flight:
+                    return
+
+            res = await self._done.get()
+
+            async with self._cond:
+                limits.in_flight -= 1
+                self._cond.notify_all()
+
+            yield res
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of submitted tasks which results are not consumed yet
+        """
+        return self._limits.in_flight
+
+    async def close(self) -> None:
+        """
+        Stop accepting tasks, `results` ends after remaining results are consumed
+        """
+        async with self._cond:
+            self._limits.closed = True
+            self._cond.notify_all()
+
+    async def _run(
+        self, task: Callable[[], Awaitable[Result[T, E]]], key: Hashable | None
+    ) -> None:
+        try:
+            res: Result[T, Any] = await task()
+        except Exception as exc:
+            res = Err(exc)
+
+        async with self._cond:
+            self._limits.complete(key)
+            self._cond.notify_all()
+
+        self._done.put_nowait(res)
+
+    async def __aenter__(self) -> AsyncBoundedExecutor[T, E]:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
@@ -1,8 +1,9 @@
-from typing import Iterable, TypeVar
+from typing import Any, Hashable, Iterable, TypeVar
 
-from pyferret import maybe
+from pyferret import maybe, result
 
 S = TypeVar("S")
+E = TypeVar("E")
 
 
 def from_optional(value: S | None) -> maybe.Maybe[S]:
@@ -12,5 +13,89 @@ def from_optional(value: S | None) -> maybe.Maybe[S]:
         return maybe.Nothing()
 
 
+def from_optional_many(values: Iterable[S | None]) -> list[maybe.Maybe[S]]:
+    """
+    Bulk `from_optional`, accepts any iterable or NumPy array
+
+    All `Nothing` items of the returned list are the same instance
+    """
+    nothing = maybe.Nothing()
+    just = maybe.Just
+
+    return [nothing if value is None else just(value) for value in _as_list(values)]
+
+
+def optional_mask(values: Iterable[S | None]) -> tuple[list[S | None], list[bool]]:
+    """
+    Split optionals to `(values, present_mask)` without wrapping items in `Maybe`
+    """
+    values = _as_list(values)
+
+    return values, [value is not None for value in values]
+
+
+def ok_many(values: Iterable[S], *, intern: bool = False) -> list[result.Ok[S]]:
+    """
+    Wrap every value in `Ok`
+
+    With `intern=True` equal `str`, `bytes`, `int` and `bool` values share one
+    instance, it's slower and pays off only when values repeat a lot
+    """
+    if intern:
+        return _interned(result.Ok, values)
+
+    ok = result.Ok
+
+    return [ok(value) for value in _as_list(values)]
+
+
+def err_many(errors: Iterable[E], *, intern: bool = False) -> list[result.Err[E]]:
+    """
+    Wrap every error in `Err`
+
+    With `intern=True` equal `str`, `bytes`, `int` and `bool` errors share one
+    instance, it's slower and pays off only when errors repeat a lot
+    """
+    if intern:
+        return _interned(result.Err, errors)
+
+    err = result.Err
+
+    return [err(error) for error in _as_list(errors)]
+
+
 def concat(iterable: Iterable[Iterable[S]]) -> list[S]:
     return [item for sublist in iterable for item in sublist]
+
+
+def _as_list(values: Iterable[Any]) -> list[Any]:
+    # NumPy arrays are converted to Python objects in one C-level call
+    tolist = getattr(values, "tolist", None)
+
+    return tolist() if tolist is not None else list(values)
+
+
+# Types which equal values are indistinguishable, other equal values may differ
+# (`0.0` and `-0.0`, `(1,)` and `(1.0,)`, `Decimal("1.0")` and `Decimal("1.00")`)
+INTERNABLE = frozenset((str, bytes, int, bool))
+
+
+def _interned(cls: Any, values: Iterable[Any]) -> list[Any]:
+    interned: dict[tuple[type, Hashable], Any] = {}
+    items = []
+
+    for value in _as_list(values):
+        kind = value.__class__
+
+        if kind in INTERNABLE:
+            key = (kind, value)
+            item = interned.get(key)
+
+            if item is None:
+                item = interned[key] = cls(value)
+        else:
+            item = cls(value)
+
+        items.append(item)
+
+    return items
@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import csv
+import json
+import mmap
+import os
+import struct
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Generator, Iterator, TypeAlias
+
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err, Ok, Result
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+Buffer: TypeAlias = bytes | bytearray | mmap.mmap
+Source: TypeAlias = str | os.PathLike[str] | IO[bytes] | Buffer
+Record: TypeAlias = Any
+
+
+class ParseError(Exception):
+    """
+    Error of parsing a single record, keeps position of the record in source
+    """
+
+    def __init__(self, line_no: int, offset: int, exc: Exception) -> None:
+        super().__init__(line_no, offset, exc)
+        self.line_no = line_no
+        self.offset = offset
+        self.exc = exc
+
+    def __str__(self) -> str:
+        return f"line {self.line_no} (offset {self.offset}): {self.exc}"
+
+
+class DecodeError(Exception):
+    """
+    Error of decoding a binary record at `offset`
+    """
+
+    def __init__(self, offset: int, reason: str) -> None:
+        super().__init__(offset, reason)
+        self.offset = offset
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"offset {self.offset}: {self.reason}"
+
+
+def read_mapped(path: str | os.PathLike[str]) -> Result[memoryview, OSError]:
+    """
+    Memory-map file for reading and return `Ok[memoryview]` over its content or
+    `Err[OSError]`, no bytes are copied
+
+    Mapping stays alive while the view or its slices are referenced
+    """
+    try:
+        with open(path, "rb") as file:  # noqa: PTH123
+            if not os.fstat(file.fileno()).st_size:
+                return Ok(memoryview(b""))
+
+            return Ok(memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)))
+    except OSError as exc:
+        return Err(exc)
+
+
+def window(view: memoryview, start: int, size: int) -> Maybe[memoryview]:
+    """
+    Return `Just[memoryview]` of `size` bytes from `start` or `Nothing` if the window
+    doesn't fit in `view`
+    """
+    if start < 0 or size < 0 or start + size > len(view):
+        return Nothing()
+
+    return Just(view[start : start + size])
+
+
+def iter_fixed_records(
+    view: memoryview, size: int
+) -> Iterator[Result[memoryview, DecodeError]]:
+    """
+    Yield `Ok[memoryview]` for every record of `size` bytes, incomplete trailing
+    record is yielded as `Err[DecodeError]`
+    """
+    if size <= 0:
+        raise ValueError("Record size must be positive")
+
+    end = len(view)
+    full = end - end % size
+
+    for offset in range(0, full, size):
+        yield Ok(view[offset : offset + size])
+
+    if full != end:
+        yield Err(DecodeError(full, f"Truncated record: {end - full} of {size} bytes"))
+
+
+def iter_length_prefixed(
+    view: memoryview, prefix: str = "<I"
+) -> Iterator[Result[memoryview, DecodeError]]:
+    """
+    Yield `Ok[memoryview]` payload of every record prefixed by its length packed as
+    `struct` format `prefix`
+
+    Records can't be resynchronized after a broken one, so `Err[DecodeError]` is the
+    last yielded item
+    """
+    header = struct.Struct(prefix)
+    offset, end = 0, len(view)
+
+    while offset < end:
+        if offset + header.size > end:
+            yield Err(DecodeError(offset, "Truncated length prefix"))
+            return
+
+        (length,) = header.unpack_from(view, offset)
+        start = offset + header.size
+
+        if length < 0 or start + length > end:
+            yield Err(DecodeError(offset, f"Record length {length} exceeds data"))
+            return
+
+        yield Ok(view[start : start + length])
+        offset = start + length
+
+
+def read_ndjson(
+    source: Source,
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: int | None = None,
+) -> Iterator[Result[Record, ParseError]]:
+    """
+    Lazily parse line-delimited JSON and yield `Ok[record]` or `Err[ParseError]` for
+    every non-blank line of `source`
+
+    With `workers` blocks are parsed in a process pool, records keep source order
+    """
+    return _read(source, ("json",), block_size, workers)
+
+
+def read_csv(
+    source: Source,
+    *,
+    header: bool = False,
+    dialect: str = "excel",
+    encoding: str = "utf-8",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: int | None = None,
+) -> Iterator[Result[list[str] | dict[str, str], ParseError]]:
+    """
+    Lazily parse CSV with one record per line and yield `Ok[row]` or `Err[ParseError]`
+    for every non-blank line of `source`
+
+    If `header` - first line is used as field names and rows are yielded as dicts
+    With `workers` blocks are parsed in a process pool, records keep source order
+    """
+    if not header:
+        return _read(source, ("csv", encoding, dialect, None), block_size, workers)
+
+    return _read_csv_with_header(source, encoding, dialect, block_size, workers)
+
+
+def _read_csv_with_header(
+    source: Source,
+    encoding: str,
+    dialect: str,
+    block_size: int,
+    workers: int | None,
+) -> Iterator[Result[list[str] | dict[str, str], ParseError]]:
+    if not workers:
+        lines = _iter_lines(source, block_size)
+
+        for line_no, offset, line in lines:
+            res = _parse_csv_line(line, line_no, offset, encoding, dialect, None)
+
+            if isinstance(res, Err):
+                yield res
+                return
+
+            options = ("csv", encoding, dialect, tuple(res._value))
+
+            yield from _parse_lines(lines, options)
+            return
+
+        return
+
+    blocks = _iter_blocks(source, block_size)
+
+    for start_line, start_offset, block in blocks:
+        for line_no, offset, line in _split_lines(block, start_line, start_offset):
+            res = _parse_csv_line(line, line_no, offset, encoding, dialect, None)
+
+            if isinstance(res, Err):
+                yield res
+                return
+
+            end = block.find(b"\n", offset - start_offset) + 1 or len(block)
+            options = ("csv", encoding, dialect, tuple(res._value))
+            rest = _chain_block(line_no + 1, start_offset + end, block[end:], blocks)
+
+            yield from _parse_blocks(rest, options, workers)
+            return
+
+
+def _chain_block(
+    line_no: int,
+    offset: int,
+    block: bytes,
+    blocks: Iterator[tuple[int, int, bytes]],
+) -> Iterator[tuple[int, int, bytes]]:
+    if block:
+        yield line_no, offset, block
+
+    yield from blocks
+
+
+def _read(
+    source: Source,
+    options: tuple[Any, ...],
+    block_size: int,
+    workers: int | None,
+) -> Iterator[Result[Any, ParseError]]:
+    if not workers:
+        return _parse_lines(_iter_lines(source, block_size), options)
+
+    return _parse_blocks(_iter_blocks(source, block_size), options, workers)
+
+
+def _parse_blocks(
+    blocks: Iterator[tuple[int, int, bytes]],
+    options: tuple[Any, ...],
+    workers: int,
+) -> Iterator[Result[Any, ParseError]]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: list[Future[list[Result[Any, ParseError]]]] = []
+
+        for line_no, offset, block in blocks:
+            pending.append(
+                executor.submit(_parse_chunk, block, line_no, offset, options)
+            )
+
+            if len(pending) >= workers * 2:
+                yield from pending.pop(0).result()
+
+        for future in pending:
+            yield from future.result()
+
+
+def _parse_chunk(
+    block: bytes, line_no: int, offset: int, options: tuple[Any, ...]
+) -> list[Result[Any, ParseError]]:
+    return list(_parse_lines(_split_lines(block, line_no, offset), options))
+
+
+def _parse_lines(
+    lines: Iterator[tuple[int, int, bytes | bytearray]], options: tuple[Any, ...]
+) -> Iterator[Result[Any, ParseError]]:
+    if options[0] == "json":
+        for line_no, offset, line in lines:
+            try:
+                yield Ok(json.loads(line))
+            except ValueError as exc:
+                yield Err(ParseError(line_no, offset, exc))
+    else:
+        _, encoding, dialect, fieldnames = options
+
+        for line_no, offset, line in lines:
+            yield _parse_csv_line(line, line_no, offset, encoding, dialect, fieldnames)
+
+
+def _parse_csv_line(
+    line: bytes | bytearray,
+    line_no: int,
+    offset: int,
+    encoding: str,
+    dialect: str,
+    fieldnames: tuple[str, ...] | None,
+) -> Result[list[str] | dict[str, str], ParseError]:
+    try:
+        row = next(csv.reader((line.decode(encoding),), dialect))
+    except (csv.Error, UnicodeDecodeError, StopIteration) as exc:
+        return Err(ParseError(line_no, offset, exc))
+
+    if fieldnames is None:
+        return Ok(row)
+
+    if len(row) != len(fieldnames):
+        return Err(
+            ParseError(
+                line_no,
+                offset,
+                ValueError(f"Expected {len(fieldnames)} fields, got {len(row)}"),
+            )
+        )
+
+    return Ok(dict(zip(fieldnames, row)))
+
+
+def _split_lines(
+    block: bytes, line_no: int, offset: int
+) -> Iterator[tuple[int, int, bytes | bytearray]]:
+    """
+    Yield `(line_no, offset, line)` for every non-blank line of a block of complete
+    lines
+    """
+    yield from _scan_lines(block, 0, len(block), line_no, offset)
+
+
+def _scan_lines(
+    data: Buffer, start: int, stop: int, line_no: int, offset: int
+) -> Generator[tuple[int, int, bytes | bytearray], None, int]:
+    """
+    Yield `(line_no, offset, line)` for every non-blank line of `data[start:stop]`
+    where `offset` is position of `data[start]` in source, returns next line number
+
+    Every line is sliced from `data` once, without line break
+    """
+    find = data.find
+    pos = start
+    base = offset - start
+
+    while pos < stop:
+        end = find(b"\n", pos, stop)
+
+        if end < 0:
+            end = stop
+
+        # Drop "\r" of CRLF line break before slicing
+        line = data[pos : end - 1 if end > pos and data[end - 1] == 13 else end]
+
+        if line and not line.isspace():
+            yield line_no, base + pos, line
+
+        line_no += 1
+        pos = end + 1
+
+    return line_no
+
+
+def _iter_lines(
+    source: Source, block_size: int
+) -> Iterator[tuple[int, int, bytes | bytearray]]:
+    """
+    Yield `(line_no, offset, line)` for every non-blank line of `source`
+    """
+    if isinstance(source, bytes | bytearray | mmap.mmap):
+        yield from _scan_lines(source, 0, len(source), 1, 0)
+    elif isinstance(source, str | os.PathLike):
+        with open(source, "rb") as file:  # noqa: PTH123
+            yield from _iter_file_lines(file, block_size)
+    else:
+        yield from _iter_file_lines(source, block_size)
+
+
+def _iter_file_lines(
+    file: IO[bytes], block_size: int
+) -> Iterator[tuple[int, int, bytes | bytearray]]:
+    # Lines are sliced from read chunks, only a line crossing chunk boundary is
+    # joined from its parts first
+    line_no, offset = 1, 0
+    parts: list[bytes] = []
+
+    while chunk := file.read(block_size):
+        start = 0
+
+        if parts:
+            first = chunk.find(b"\n") + 1
+
+            if not first:
+                parts.append(chunk)
+                continue
+
+            parts.append(chunk[:first])
+            line = b"".join(parts)
+            parts = []
+            line_no = yield from _scan_lines(line, 0, len(line), line_no, offset)
+            offset += len(line)
+            start = first
+
+        end = chunk.rfind(b"\n", start) + 1
+
+        if end:
+            line_no = yield from _scan_lines(chunk, start, end, line_no, offset)
+            offset += end - start
+        else:
+            end = start
+
+        if end < len(chunk):
+            parts.append(chunk[end:])
+
+    if parts:
+        line = b"".join(parts)
+        yield from _scan_lines(line, 0, len(line), line_no, offset)
+
+
+def _iter_blocks(source: Source, block_size: int) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Yield `(first_line_no, first_offset, block)` where every block ends on a line
+    boundary, blocks are copied from source to be sent to worker processes
+    """
+    if isinstance(source, bytes | bytearray | mmap.mmap):
+        yield from _iter_buffer_blocks(source, block_size)
+    elif isinstance(source, str | os.PathLike):
+        with open(source, "rb") as file:  # noqa: PTH123
+            yield from _iter_file_blocks(file, block_size)
+    else:
+        yield from _iter_file_blocks(source, block_size)
+
+
+def _iter_buffer_blocks(
+    buffer: Buffer, block_size: int
+) -> Iterator[tuple[int, int, bytes]]:
+    line_no, pos, size = 1, 0, len(buffer)
+
+    while pos < size:
+        end = buffer.rfind(b"\n", pos, pos + block_size) + 1
+
+        if end <= pos:
+            end = buffer.find(b"\n", pos + block_size) + 1 or size
+
+        block = bytes(buffer[pos:end])
+        yield line_no, pos, block
+
+        line_no += block.count(b"\n")
+        pos = end
+
+
+def _iter_file_blocks(
+    file: IO[bytes], block_size: int
+) -> Iterator[tuple[int, int, bytes]]:
+    line_no, offset, carry = 1, 0, b""
+
+    while chunk := file.read(block_size):
+        end = chunk.rfind(b"\n") + 1
+
+        if not end:
+            carry += chunk
+            continue
+
+        block = carry + chunk[:end] if carry else chunk[:end]
+        carry = chunk[end:]
+        yield line_no, offset, block
+
+        line_no += block.count(b"\n")
+        offset += len(block)
+
+    if carry:
+        yield line_no, offset, carry
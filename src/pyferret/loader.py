@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    TypeVar,
+)
+
+from pyferret.helpers import from_optional
+
+if TYPE_CHECKING:
+    from pyferret.maybe import Maybe
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce `load(key)` calls made within `window` seconds into one
+    `bulk_fn(keys) -> Mapping[K, V]` call with deduplicated keys
+
+    Every future resolves to `Just(value)`, or `Nothing` if key is missing from the
+    mapping or its value is `None`. Exception raised by `bulk_fn` is set on all
+    futures of the batch. Batch is dispatched early when `max_batch_size` keys are
+    pending or `dispatch` is called
+
+    Loaded futures are cached by key unless `cache=False`, so create a loader per
+    request to keep the cache short-lived
+    """
+
+    def __init__(
+        self,
+        bulk_fn: Callable[[list[K]], Mapping[K, V]],
+        *,
+        window: float = 0.001,
+        max_batch_size: int | None = None,
+        cache: bool = True,
+    ) -> None:
+        self._bulk_fn = bulk_fn
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._cache_enabled = cache
+        self._cache: dict[K, Future[Maybe[V]]] = {}
+        self._pending: dict[K, Future[Maybe[V]]] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self.batches = 0
+
+    def load(self, key: K) -> Future[Maybe[V]]:
+        """
+        Future of `Maybe` value for `key`, `future.result()` blocks until its batch
+        is loaded
+        """
+        with self._lock:
+            future = self._cache.get(key) or self._pending.get(key)
+
+            if future is not None:
+                return future
+
+            future = self._pending[key] = Future()
+
+            if self._cache_enabled:
+                self._cache[key] = future
+
+            if self._max_batch_size and len(self._pending) >= self._max_batch_size:
+                batch = self._take()
+            else:
+                batch = {}
+
+                if self._timer is None:
+                    self._timer = threading.Timer(self._window, self.dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch:
+            self._run(batch)
+
+        return future
+
+    def load_many(self, keys: Iterable[K]) -> list[Future[Maybe[V]]]:
+        return [self.load(key) for key in keys]
+
+    def dispatch(self) -> None:
+        """
+        Load pending keys now in the calling thread
+        """
+        with self._lock:
+            batch = self._take()
+
+        if batch:
+            self._run(batch)
+
+    def prime(self, key: K, value: V) -> None:
+        """
+        Put loaded `value` to the cache
+        """
+        future: Future[Maybe[V]] = Future()
+        future.set_result(from_optional(value))
+
+        with self._lock:
+            self._cache[key] = future
+
+    def clear(self, key: K | None = None) -> None:
+        """
+        Drop `key`, or the whole cache if no key is given
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def _take(self) -> dict[K, Future[Maybe[V]]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+
+        if batch:
+            self.batches += 1
+
+        return batch
+
+    def _run(self, batch: dict[K, Future[Maybe[V]]]) -> None:
+        try:
+            values = self._bulk_fn(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+
+            self._forget(batch)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(from_optional(values.get(key)))
+
+    def _forget(self, batch: dict[K, Future[Maybe[V]]]) -> None:
+        # Failed loads are not cached, next `load` tries again
+        with self._lock:
+            for key, future in batch.items():
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+
+
+class AsyncBatchLoader(Generic[K, V]):
+    """
+    Asyncio flavour of `BatchLoader` for `bulk_fn(keys) -> Awaitable[Mapping[K, V]]`
+
+    With `window=0` keys requested in the same event loop iteration are loaded
+    together, e.g. by coroutines started with `asyncio.gather`
+    """
+
+    def __init__(
+        self,
+        bulk_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        window: float = 0.0,
+        max_batch_size: int | None = None,
+        cache: bool = True,
+    ) -> None:
+        self._bulk_fn = bulk_fn
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._cache_enabled = cache
+        self._cache: dict[K, asyncio.Future[Maybe[V]]] = {}
+        self._pending: dict[K, asyncio.Future[Maybe[V]]] = {}
+        self._handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+
+    def load(self, key: K) -> asyncio.Future[Maybe[V]]:
+        """
+        Awaitable `Maybe` value for `key`, must be called with running event loop
+
+        Every caller gets its own shielded view of the shared load, so cancelling one
+        caller doesn't affect others waiting for the same key
+        """
+        future = self._cache.get(key) or self._pending.get(key)
+
+        if future is not None and not future.cancelled():
+            return asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = self._pending[key] = loop.create_future()
+
+        if self._cache_enabled:
+            self._cache[key] = future
+
+        if self._max_batch_size and len(self._pending) >= self._max_batch_size:
+            self.dispatch()
+        elif self._handle is None:
+            self._handle = (
+                loop.call_later(self._window, self.dispatch)
+                if self._window
+                else loop.call_soon(self.dispatch)
+            )
+
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[Maybe[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def dispatch(self) -> None:
+        """
+        Start loading pending keys now
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        batch, self._pending = self._pending, {}
+
+        if not batch:
+            return
+
+        self.batches += 1
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def prime(self, key: K, value: V) -> None:
+        """
+        Put loaded `value` to the cache, must be called with running event loop
+        """
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(from_optional(value))
+        self._cache[key] = future
+
+    def clear(self, key: K | None = None) -> None:
+        """
+        Drop `key`, or the whole cache if no key is given
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    async def _run(self, batch: dict[K, asyncio.Future[Maybe[V]]]) -> None:
+        try:
+            values = await self._bulk_fn(list(batch))
+        except BaseException as exc:
+            # Failed and cancelled loads are not cached, next `load` tries again
+            for key, future in batch.items():
+                if not future.done():
+                    if isinstance(exc, Exception):
+                        future.set_exception(exc)
+                    else:
+                        future.cancel()
+
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+
+            if not isinstance(exc, Exception):
+                raise
+
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(from_optional(values.get(key)))
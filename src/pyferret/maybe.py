@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Concatenate, NoReturn, ParamSpec, TypeAlias, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Concatenate,
+    NoReturn,
+    ParamSpec,
+    TypeAlias,
+    TypeVar,
+)
 
 from pyferret import abstract, result
 
+if TYPE_CHECKING:
+    from pyferret.step import Step
+
 T = TypeVar("T", covariant=True)
 S = TypeVar("S")
 U = TypeVar("U")
@@ -53,6 +65,12 @@ class Just(abstract.Monad[T]):
 
         return self
 
+    def fmap_step(self, step: Step[T, S]) -> Just[S]:
+        """
+        If `Just[T]` - applies pre-bound `Step[T, S]` to `T` and returns `Just[S]`
+        """
+        return Just(step.call(self._value))
+
     def bind(self, func: Callable[[T], Maybe[S]]) -> Maybe[S]:
         """
         If `Just[T]` - applying `(T -> Maybe[S])`, and returns `Maybe[S]`
@@ -94,6 +112,13 @@ class Just(abstract.Monad[T]):
         _ = func(self._value, *args, **kwargs)
         return self
 
+    def bind_step(self, step: Step[T, Maybe[S]]) -> Maybe[S]:
+        """
+        If `Just[T]` - applies pre-bound `Step[T, Maybe[S]]` to `T` and returns
+        `Maybe[S]`
+        """
+        return step.call(self._value)
+
     def bind_result(
         self, func: Callable[[T], result.Result[S, E]]
     ) -> result.Result[Maybe[S], E]:
@@ -107,6 +132,12 @@ class Just(abstract.Monad[T]):
         else:
             return res
 
+    def or_else(self, func: Callable[[], Maybe[S]]) -> Just[T]:
+        """
+        If `Just[T]` returns `Just[T]`
+        """
+        return self
+
     @property
     def is_some(self) -> bool:
         """
@@ -169,6 +200,12 @@ class Nothing(abstract.Monad[None]):
         """
         return self
 
+    def fmap_step(self, step: Step[V, K]) -> Nothing:
+        """
+        If `Nothing` returns `Nothing`
+        """
+        return self
+
     def bind(self, func: Callable[[V], Maybe[S]]) -> Nothing:
         """
         If `Nothing` returns `Nothing`
@@ -203,6 +240,12 @@ class Nothing(abstract.Monad[None]):
         """
         return self
 
+    def bind_step(self, step: Step[V, Maybe[S]]) -> Nothing:
+        """
+        If `Nothing` returns `Nothing`
+        """
+        return self
+
     def bind_result(
         self, func: Callable[[V], result.Result[S, E]]
     ) -> result.Ok[Nothing]:
@@ -211,6 +254,12 @@ class Nothing(abstract.Monad[None]):
         """
         return result.Ok(self)
 
+    def or_else(self, func: Callable[[], Maybe[S]]) -> Maybe[S]:
+        """
+        If `Nothing` - calls `(() -> Maybe[S])` and returns `Maybe[S]`
+        """
+        return func()
+
     @property
     def is_some(self) -> bool:
         """
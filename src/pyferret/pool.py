@@ -0,0 +1,502 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Literal,
+    TypeAlias,
+    TypeVar,
+)
+
+from pyferret.result import Err, Ok, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+R = TypeVar("R")
+
+Reason: TypeAlias = Literal["timeout", "closed", "create"]
+
+
+class PoolError(Exception):
+    """
+    Error returned by `acquire` when no resource can be leased, `reason` is
+    `"timeout"`, `"closed"` or `"create"` (factory raised, see `__cause__`)
+    """
+
+    def __init__(self, reason: Reason) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+    def __str__(self) -> str:
+        if self.reason == "timeout":
+            return "Timed out waiting for a pool resource"
+
+        if self.reason == "closed":
+            return "Pool is closed"
+
+        return f"Failed to create a pool resource: {self.__cause__!r}"
+
+
+class _Slots(Generic[R]):
+    """
+    Bookkeeping shared by sync and async pools
+
+    `size` counts idle, leased and being created resources, a slot for a new resource
+    is reserved before the factory is called
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.idle: list[R] = []
+        self.size = 0
+        self.in_use = 0
+        self.closed = False
+        self.created = 0
+        self.evicted = 0
+
+    def available(self) -> bool:
+        return self.closed or bool(self.idle) or self.size < self.max_size
+
+    def take(self) -> tuple[bool, R | None]:
+        """
+        Lease idle resource `(False, resource)` or reserve a new one `(True, None)`,
+        `available` must be checked first
+        """
+        self.in_use += 1
+
+        if self.idle:
+            return False, self.idle.pop()
+
+        self.size += 1
+        self.created += 1
+        return True, None
+
+    def lost(self, *, evicted: bool) -> None:
+        """
+        Drop leased resource which failed validation, or reserved slot which
+        resource failed to be created
+        """
+        self.size -= 1
+        self.in_use -= 1
+
+        if evicted:
+            self.evicted += 1
+        else:
+            self.created -= 1
+
+    def give_back(self, resource: R, broken: bool) -> bool:
+        """
+        Return leased resource, `True` if it must be disposed
+        """
+        self.in_use -= 1
+
+        if broken or self.closed:
+            self.size -= 1
+            self.evicted += broken
+            return True
+
+        self.idle.append(resource)
+        return False
+
+    def drain(self) -> list[R]:
+        self.closed = True
+        idle, self.idle = self.idle, []
+        self.size -= len(idle)
+
+        return idle
+
+
+class Lease(Generic[R]):
+    """
+    Resource leased from `Pool`, returned to the pool by `release` or evicted by
+    `invalidate`. Used as context manager it's released on exit, or evicted if the
+    block raised
+    """
+
+    def __init__(self, pool: Pool[R], resource: R) -> None:
+        self._pool = pool
+        self.resource = resource
+        self.released = False
+
+    def release(self) -> None:
+        self._pool._release(self, broken=False)
+
+    def invalidate(self) -> None:
+        self._pool._release(self, broken=True)
+
+    def __enter__(self) -> R:
+        return self.resource
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        self._pool._release(self, broken=exc_type is not None)
+
+
+class Pool(Generic[R]):
+    """
+    Thread-safe pool of at most `max_size` resources created by `factory`
+
+    `acquire` returns `Err[PoolError]` instead of raising or blocking longer than
+    `timeout`. Idle resource failing `validate` on borrow is disposed and replaced,
+    invalidated and failed leases are disposed too. Resources are disposed with
+    `dispose`, or not at all if it's not given
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], R],
+        *,
+        max_size: int = 10,
+        timeout: float | None = None,
+        validate: Callable[[R], bool] | None = None,
+        dispose: Callable[[R], Any] | None = None,
+    ) -> None:
+        self._slots: _Slots[R] = _Slots(max_size)
+        self._factory = factory
+        self._timeout = timeout
+        self._validate = validate
+        self._dispose = dispose
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float | None = None) -> Result[Lease[R], PoolError]:
+        """
+        Lease a resource waiting up to `timeout`, or the pool timeout if not given
+        """
+        timeout = self._timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        slots = self._slots
+
+        while True:
+            with self._cond:
+                left = None if deadline is None else deadline - time.monotonic()
+
+                if not self._cond.wait_for(slots.available, left):
+                    return Err(PoolError("timeout"))
+
+                if slots.closed:
+                    return Err(PoolError("closed"))
+
+                create, resource = slots.take()
+
+            if create:
+                try:
+                    return Ok(Lease(self, self._factory()))
+                except Exception as exc:
+                    self._lost(evicted=False)
+                    error = PoolError("create")
+                    error.__cause__ = exc
+                    return Err(error)
+                except BaseException:
+                    self._lost(evicted=False)
+                    raise
+
+            try:
+                valid = self._is_valid(resource)
+            except BaseException:
+                self._restore(resource)  # type: ignore[arg-type]
+                raise
+
+            if valid:
+                return Ok(Lease(self, resource))  # type: ignore[arg-type]
+
+            self._lost(evicted=True)
+            self._close_resource(resource)  # type: ignore[arg-type]
+
+    def use(self, func: Callable[[R], Result[T, E]]) -> Result[T, E | PoolError]:
+        """
+        Acquire a resource, call `func` with it and release it
+
+        Resource is evicted if `func` raises, exception is re-raised
+        """
+        leased = self.acquire()
+
+        if isinstance(leased, Err):
+            return leased
+
+        with leased.ok_value as resource:
+            return func(resource)
+
+    @property
+    def size(self) -> int:
+        return self._slots.size
+
+    @property
+    def idle(self) -> int:
+        return len(self._slots.idle)
+
+    @property
+    def in_use(self) -> int:
+        return self._slots.in_use
+
+    @property
+    def max_size(self) -> int:
+        return self._slots.max_size
+
+    @property
+    def created(self) -> int:
+        return self._slots.created
+
+    @property
+    def evicted(self) -> int:
+        return self._slots.evicted
+
+    def close(self) -> None:
+        """
+        Dispose idle resources, leased ones are disposed when released
+        """
+        with self._cond:
+            idle = self._slots.drain()
+            self._cond.notify_all()
+
+        for resource in idle:
+            self._close_resource(resource)
+
+    def _is_valid(self, resource: Any) -> bool:
+        if self._validate is None:
+            return True
+
+        try:
+            return self._validate(resource)
+        except Exception:
+            return False
+
+    def _close_resource(self, resource: R) -> None:
+        if self._dispose is not None:
+            with contextlib.suppress(Exception):
+                self._dispose(resource)
+
+    def _lost(self, *, evicted: bool) -> None:
+        with self._cond:
+            self._slots.lost(evicted=evicted)
+            self._cond.notify()
+
+    def _restore(self, resource: R) -> None:
+        with self._cond:
+            dispose = self._slots.give_back(resource, broken=False)
+            self._cond.notify()
+
+        if dispose:
+            self._close_resource(resource)
+
+    def _release(self, lease: Lease[R], *, broken: bool) -> None:
+        with self._cond:
+            if lease.released:
+                return
+
+            lease.released = True
+            dispose = self._slots.give_back(lease.resource, broken)
+            self._cond.notify()
+
+        if dispose:
+            self._close_resource(lease.resource)
+
+    def __enter__(self) -> Pool[R]:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncLease(Generic[R]):
+    """
+    Resource leased from `AsyncPool`, see `Lease`
+    """
+
+    def __init__(self, pool: AsyncPool[R], resource: R) -> None:
+        self._pool = pool
+        self.resource = resource
+        self.released = False
+
+    async def release(self) -> None:
+        await self._pool._release(self, broken=False)
+
+    async def invalidate(self) -> None:
+        await self._pool._release(self, broken=True)
+
+    async def __aenter__(self) -> R:
+        return self.resource
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, *exc_info: object
+    ) -> None:
+        await self._pool._release(self, broken=exc_type is not None)
+
+
+class AsyncPool(Generic[R]):
+    """
+    Asyncio flavour of `Pool` with async `factory`, `validate` and `dispose`
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[R]],
+        *,
+        max_size: int = 10,
+        timeout: float | None = None,
+        validate: Callable[[R], Awaitable[bool]] | None = None,
+        dispose: Callable[[R], Awaitable[Any]] | None = None,
+    ) -> None:
+        self._slots: _Slots[R] = _Slots(max_size)
+        self._factory = factory
+        self._timeout = timeout
+        self._validate = validate
+        self._dispose = dispose
+        self._cond = asyncio.Condition()
+
+    async def acquire(
+        self, timeout: float | None = None
+    ) -> Result[AsyncLease[R], PoolError]:
+        """
+        Lease a resource waiting up to `timeout`, or the pool timeout if not given
+        """
+        timeout = self._timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        slots = self._slots
+
+        while True:
+            async with self._cond:
+                left = None if deadline is None else deadline - loop.time()
+
+                if not slots.available():
+                    try:
+                        await asyncio.wait_for(
+                            self._cond.wait_for(slots.available), left
+                        )
+                    except asyncio.TimeoutError:
+                        return Err(PoolError("timeout"))
+
+                if slots.closed:
+                    return Err(PoolError("closed"))
+
+                create, resource = slots.take()
+
+            # Reserved slot must be returned even if the task is cancelled while
+            # awaiting, so the bookkeeping is shielded from a repeated cancellation
+            if create:
+                try:
+                    return Ok(AsyncLease(self, await self._factory()))
+                except Exception as exc:
+                    await asyncio.shield(self._lost(evicted=False))
+                    error = PoolError("create")
+                    error.__cause__ = exc
+                    return Err(error)
+                except BaseException:
+                    await asyncio.shield(self._lost(evicted=False))
+                    raise
+
+            try:
+                valid = await self._is_valid(resource)
+            except BaseException:
+                await asyncio.shield(self._restore(resource))  # type: ignore[arg-type]
+                raise
+
+            if valid:
+                return Ok(AsyncLease(self, resource))  # type: ignore[arg-type]
+
+            await asyncio.shield(self._lost(evicted=True))
+            await self._close_resource(resource)  # type: ignore[arg-type]
+
+    async def use(
+        self, func: Callable[[R], Awaitable[Result[T, E]]]
+    ) -> Result[T, E | PoolError]:
+        """
+        Acquire a resource, await `func` with it and release it
+
+        Resource is evicted if `func` raises, exception is re-raised
+        """
+        leased = await self.acquire()
+
+        if isinstance(leased, Err):
+            return leased
+
+        async with leased.ok_value as resource:
+            return await func(resource)
+
+    @property
+    def size(self) -> int:
+        return self._slots.size
+
+    @property
+    def idle(self) -> int:
+        return len(self._slots.idle)
+
+    @property
+    def in_use(self) -> int:
+        return self._slots.in_use
+
+    @property
+    def max_size(self) -> int:
+        return self._slots.max_size
+
+    @property
+    def created(self) -> int:
+        return self._slots.created
+
+    @property
+    def evicted(self) -> int:
+        return self._slots.evicted
+
+    async def close(self) -> None:
+        """
+        Dispose idle resources, leased ones are disposed when released
+        """
+        async with self._cond:
+            idle = self._slots.drain()
+            self._cond.notify_all()
+
+        for resource in idle:
+            await self._close_resource(resource)
+
+    async def _is_valid(self, resource: Any) -> bool:
+        if self._validate is None:
+            return True
+
+        try:
+            return await self._validate(resource)
+        except Exception:
+            return False
+
+    async def _close_resource(self, resource: R) -> None:
+        if self._dispose is not None:
+            with contextlib.suppress(Exception):
+                await self._dispose(resource)
+
+    async def _lost(self, *, evicted: bool) -> None:
+        async with self._cond:
+            self._slots.lost(evicted=evicted)
+            self._cond.notify()
+
+    async def _restore(self, resource: R) -> None:
+        async with self._cond:
+            dispose = self._slots.give_back(resource, broken=False)
+            self._cond.notify()
+
+        if dispose:
+            await self._close_resource(resource)
+
+    async def _release(self, lease: AsyncLease[R], *, broken: bool) -> None:
+        async with self._cond:
+            if lease.released:
+                return
+
+            lease.released = True
+            dispose = self._slots.give_back(lease.resource, broken)
+            self._cond.notify()
+
+        if dispose:
+            await self._close_resource(lease.resource)
+
+    async def __aenter__(self) -> AsyncPool[R]:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
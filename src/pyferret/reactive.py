@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from pyferret import abstract, maybe, result
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class Cell(Generic[T]):
+    """
+    Node of recomputation graph that holds a `Maybe` or `Result`
+
+    Derived cells are recomputed only when one of their sources changed, a value equal
+    to the previous one stops propagation. Graph is not synchronized, update it from
+    one thread
+    """
+
+    def __init__(
+        self,
+        value: abstract.Monad[T],
+        sources: tuple[Cell[Any], ...] = (),
+        compute: Callable[[], abstract.Monad[T]] | None = None,
+    ) -> None:
+        self._value = value
+        self._sources = sources
+        self._compute = compute
+        self._dependents: list[Cell[Any]] = []
+        self.rank: int = max((s.rank for s in sources), default=-1) + 1
+        self.computations = 0 if compute is None else 1
+
+        for source in sources:
+            source._dependents.append(self)
+
+    @property
+    def value(self) -> abstract.Monad[T]:
+        return self._value
+
+    def fmap(self, func: Callable[[T], S]) -> Cell[S]:
+        """
+        Derived cell holding `self.value.fmap(func)`
+        """
+        return Cell(self._value.fmap(func), (self,), lambda: self._value.fmap(func))
+
+    def bind(self, func: Callable[[T], Any]) -> Cell[Any]:
+        """
+        Derived cell holding `self.value.bind(func)`
+        """
+        return Cell(self._value.bind(func), (self,), lambda: self._value.bind(func))
+
+    def _recompute(self) -> bool:
+        assert self._compute is not None
+
+        value = self._compute()
+        self.computations += 1
+
+        if value == self._value:
+            return False
+
+        self._value = value
+        return True
+
+    def __repr__(self) -> str:
+        return f"Cell {self._value!r}"
+
+
+class Input(Cell[T]):
+    """
+    Cell which value is set from outside of the graph
+    """
+
+    def __init__(self, value: abstract.Monad[T]) -> None:
+        super().__init__(value)
+
+    def set(self, value: abstract.Monad[T]) -> None:
+        """
+        Set value and recompute dependent cells
+        """
+        update({self: value})
+
+
+def combine(func: Callable[..., Any], *cells: Cell[Any]) -> Cell[Any]:
+    """
+    Derived cell holding `func(*values)` which returns `Maybe` or `Result`
+
+    `func` is not called while one of the cells holds `Nothing` or `Err`, the first
+    such value is held instead
+    """
+
+    def compute() -> Any:
+        values = []
+
+        for cell in cells:
+            value = cell._value
+
+            if not isinstance(value, maybe.Just | result.Ok):
+                return value
+
+            values.append(value._value)
+
+        return func(*values)
+
+    return Cell(compute(), cells, compute)
+
+
+def update(values: dict[Input[Any], abstract.Monad[Any]]) -> None:
+    """
+    Set several inputs at once, every affected cell is recomputed at most once
+    """
+    queue: list[tuple[int, int, Cell[Any]]] = []
+    queued: set[int] = set()
+
+    def enqueue(cells: Iterable[Cell[Any]]) -> None:
+        for cell in cells:
+            if id(cell) not in queued:
+                queued.add(id(cell))
+                heapq.heappush(queue, (cell.rank, id(cell), cell))
+
+    for source, value in values.items():
+        if value != source._value:
+            source._value = value
+            enqueue(source._dependents)
+
+    # Cells are recomputed in rank order, so all sources of a cell are final
+    while queue:
+        _, _, cell = heapq.heappop(queue)
+
+        if cell._recompute():
+            enqueue(cell._dependents)
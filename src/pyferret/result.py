@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Concatenate, NoReturn, ParamSpec, TypeAlias, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Concatenate,
+    NoReturn,
+    ParamSpec,
+    TypeAlias,
+    TypeVar,
+)
 
 from pyferret import abstract, maybe
 
+if TYPE_CHECKING:
+    from pyferret.step import Step
+
 T = TypeVar("T", covariant=True)
 E = TypeVar("E", covariant=True)
 S = TypeVar("S")
@@ -54,6 +66,12 @@ class Ok(abstract.Monad[T]):
 
         return self
 
+    def fmap_step(self, step: Step[T, S]) -> Ok[S]:
+        """
+        If `Ok[T]` - applies pre-bound `Step[T, S]` and returns `Ok[S]`
+        """
+        return Ok(step.call(self._value))
+
     def bind(self, func: Callable[[T], Result[S, E]]) -> Result[S, E]:
         """
         If `Ok[T]` - applying `(T -> Result[S, E])`, and returns `Result[S, E]`
@@ -103,6 +121,13 @@ class Ok(abstract.Monad[T]):
         else:
             return self
 
+    def bind_step(self, step: Step[T, Result[S, E]]) -> Result[S, E]:
+        """
+        If `Ok[T]` - applies pre-bound `Step[T, Result[S, E]]` and returns
+        `Result[S, E]`
+        """
+        return step.call(self._value)
+
     def bind_maybe(
         self: Ok[maybe.Maybe[S]], func: Callable[[S], Result[U, E]]
     ) -> Result[maybe.Maybe[U], E]:
@@ -122,6 +147,36 @@ class Ok(abstract.Monad[T]):
         else:
             return Ok(maybe.Nothing())
 
+    def map_err(self, func: Callable[[V], K]) -> Ok[T]:
+        """
+        If `Ok[T]` returns `Ok[T]`
+        """
+        return self
+
+    def bind_err(self, func: Callable[[V], Result[S, U]]) -> Ok[T]:
+        """
+        If `Ok[T]` returns `Ok[T]`
+        """
+        return self
+
+    def or_else(self, func: Callable[[V], Result[S, U]]) -> Ok[T]:
+        """
+        If `Ok[T]` returns `Ok[T]`
+        """
+        return self
+
+    def recover(self, func: Callable[[V], S]) -> Ok[T]:
+        """
+        If `Ok[T]` returns `Ok[T]`
+        """
+        return self
+
+    def recover_with(self, value: S) -> Ok[T]:
+        """
+        If `Ok[T]` returns `Ok[T]`
+        """
+        return self
+
     @property
     def is_err(self) -> bool:
         """
@@ -201,6 +256,12 @@ class Err(abstract.Monad[E]):
         """
         return self
 
+    def fmap_step(self, step: Step[V, K]) -> Err[E]:
+        """
+        If `Err[E]` returns `Err[E]`
+        """
+        return self
+
     def bind(self, func: Callable[[V], Result[S, U]]) -> Err[E]:
         """
         If `Err[E]` returns `Err[E]`
@@ -235,12 +296,49 @@ class Err(abstract.Monad[E]):
         """
         return self
 
+    def bind_step(self, step: Step[V, Result[S, U]]) -> Err[E]:
+        """
+        If `Err[E]` returns `Err[E]`
+        """
+        return self
+
     def bind_maybe(self, func: Callable[[V], Result[S, U]]) -> Err[E]:
         """
         If `Err[E]` returns `Err[E]`
         """
         return self
 
+    def map_err(self, func: Callable[[E], U]) -> Err[U]:
+        """
+        If `Err[E]` - applies `(E -> U)` and returns `Err[U]`
+        """
+        return Err(func(self._value))
+
+    def bind_err(self, func: Callable[[E], Result[S, U]]) -> Result[S, U]:
+        """
+        If `Err[E]` - applies `(E -> Result[S, U])` and returns `Result[S, U]`
+        """
+        return func(self._value)
+
+    def or_else(self, func: Callable[[E], Result[S, U]]) -> Result[S, U]:
+        """
+        If `Err[E]` - applies `(E -> Result[S, U])` and returns `Result[S, U]`, same
+        as `bind_err`
+        """
+        return func(self._value)
+
+    def recover(self, func: Callable[[E], S]) -> Ok[S]:
+        """
+        If `Err[E]` - applies `(E -> S)` and returns `Ok[S]`
+        """
+        return Ok(func(self._value))
+
+    def recover_with(self, value: S) -> Ok[S]:
+        """
+        If `Err[E]` returns `Ok[S]` with `value`
+        """
+        return Ok(value)
+
     @property
     def is_err(self):
         """
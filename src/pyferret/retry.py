@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+from typing import Any, Callable, ParamSpec, TypeVar
+
+from pyferret.result import Err, Ok
+
+T = TypeVar("T")
+E = TypeVar("E", covariant=True)
+P = ParamSpec("P")
+
+
+class RetriedErr(Err[E]):
+    """
+    `Err` returned by `retry`, keeps number of `attempts` and err values of all
+    attempts in `history`, the last one is the inner value. `budget_exhausted` is
+    `True` if one more retry was allowed by the policy but the budget had no tokens
+
+    Compares and hashes as a plain `Err` with the same value
+    """
+
+    def __init__(
+        self,
+        v: E,
+        attempts: int,
+        history: list[Any],
+        *,
+        budget_exhausted: bool = False,
+    ) -> None:
+        super().__init__(v)
+        self.attempts = attempts
+        self.history = history
+        self.budget_exhausted = budget_exhausted
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Err) and other._value == self._value
+
+    def __hash__(self) -> int:
+        return hash(("Err", self._value))
+
+
+class RetryBudget:
+    """
+    Shared limit of retries: every first attempt deposits `ratio` tokens, every retry
+    withdraws one token. `min_per_second` tokens are added over time so rarely called
+    functions can still retry, balance never exceeds `capacity`
+
+    Share one budget between policies to cap retries of the whole process
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        *,
+        min_per_second: float = 1.0,
+        capacity: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.rejected = 0
+        self._balance = capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._balance = min(self._balance + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        """
+        Take a token for one retry, returns `False` if the budget is exhausted
+        """
+        with self._lock:
+            self._refill()
+
+            if self._balance < 1.0:
+                self.rejected += 1
+                return False
+
+            self._balance -= 1.0
+            return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed, self._updated_at = now - self._updated_at, now
+        self._balance = min(
+            self._balance + elapsed * self.min_per_second, self.capacity
+        )
+
+
+class RetryPolicy:
+    """
+    Retry up to `max_attempts` calls while returned err value matches `predicate`
+
+    Delay before retry `n` (from 0) is uniformly random from 0 to
+    `min(max_delay, base_delay * multiplier ** n)` (exponential backoff with full
+    jitter). Every retry also needs a token from `budget` if it's given
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        predicate: Callable[[Any], bool] = lambda _: True,
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.predicate = predicate
+        self.budget = budget
+        self._rng = rng or random.Random()
+
+    def delay(self, retry: int) -> float:
+        cap = min(self.max_delay, self.base_delay * self.multiplier**retry)
+
+        return self._rng.uniform(0.0, cap)
+
+    def should_retry(self, error: Any, attempt: int) -> bool:
+        return self._allows(error, attempt) and (
+            self.budget is None or self.budget.withdraw()
+        )
+
+    def _allows(self, error: Any, attempt: int) -> bool:
+        return attempt < self.max_attempts and self.predicate(error)
+
+
+def retry(policy: RetryPolicy) -> Callable[[Callable[P, Any]], Callable[P, Any]]:
+    """
+    Decorate `(*args -> Result[T, E])`, sync or async, to call it again while it
+    returns `Err` allowed by `policy`
+
+    Final `Err` is returned as `RetriedErr` with attempts history, even if the call
+    wasn't retried. Exceptions are not retried
+    """
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                history: list[Any] = []
+
+                if policy.budget is not None:
+                    policy.budget.deposit()
+
+                while True:
+                    res = await func(*args, **kwargs)
+
+                    if isinstance(res, Ok):
+                        return res
+
+                    history.append(res._value)
+                    final = _final(policy, res, history)
+
+                    if final is not None:
+                        return final
+
+                    await asyncio.sleep(policy.delay(len(history) - 1))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            history: list[Any] = []
+
+            if policy.budget is not None:
+                policy.budget.deposit()
+
+            while True:
+                res = func(*args, **kwargs)
+
+                if isinstance(res, Ok):
+                    return res
+
+                history.append(res._value)
+                final = _final(policy, res, history)
+
+                if final is not None:
+                    return final
+
+                time.sleep(policy.delay(len(history) - 1))
+
+        return wrapper
+
+    return decorator
+
+
+def _final(
+    policy: RetryPolicy, res: Err[Any], history: list[Any]
+) -> RetriedErr[Any] | None:
+    # `None` means the call should be retried, a retry token is taken then
+    attempts = len(history)
+
+    if not policy._allows(res._value, attempts):
+        return RetriedErr(res._value, attempts, history)
+
+    if policy.budget is not None and not policy.budget.withdraw():
+        return RetriedErr(res._value, attempts, history, budget_exhausted=True)
+
+    return None
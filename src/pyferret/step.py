@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from keyword import iskeyword
+from typing import Any, Callable, Concatenate, Generic, ParamSpec, TypeVar
+
+T = TypeVar("T")
+S = TypeVar("S")
+P = ParamSpec("P")
+
+
+class Step(Generic[T, S]):
+    """
+    Function with pre-bound arguments `partial((T -> S), *args, **kwargs)` applied to
+    a value as first argument
+
+    Arguments are packed once and `call` is built for the exact call form, so applying
+    a step is cheaper than `fmap_partial`/`bind_partial` repacking arguments on every
+    call. Use it with `fmap_step`/`bind_step` or as a plain `(T -> S)` function
+    """
+
+    __slots__ = ("func", "args", "kwargs", "call")
+
+    def __init__(
+        self,
+        func: Callable[Concatenate[T, P], S],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.call: Callable[[T], S] = _specialize(func, args, kwargs)
+
+    def __call__(self, value: T) -> S:
+        return self.call(value)
+
+    def __repr__(self) -> str:
+        params = [repr(arg) for arg in self.args]
+        params += [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        name = getattr(self.func, "__qualname__", repr(self.func))
+
+        return f"Step {name}({', '.join(['_', *params])})"
+
+
+def _specialize(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Callable[[Any], Any]:
+    if not args and not kwargs:
+        return func
+
+    if not all(key.isidentifier() and not iskeyword(key) for key in kwargs):
+        return lambda value: func(value, *args, **kwargs)
+
+    # Arguments are spelled out in the call, so no tuple or dict is unpacked on every
+    # call, the same way `collections.namedtuple` builds its methods
+    namespace: dict[str, Any] = {"_func": func}
+    params = ["_value"]
+
+    for index, arg in enumerate(args):
+        namespace[f"_arg{index}"] = arg
+        params.append(f"_arg{index}")
+
+    for index, (key, arg) in enumerate(kwargs.items()):
+        namespace[f"_kwarg{index}"] = arg
+        params.append(f"{key}=_kwarg{index}")
+
+    return eval(f"lambda _value: _func({', '.join(params)})", namespace)  # noqa: S307
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import Counter, deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+from pyferret.result import Err, Ok, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+S = TypeVar("S")
+
+
+def partition_results(results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+    """
+    Split results to ok values and err values in one pass
+    """
+    oks: list[T] = []
+    errs: list[E] = []
+    ok_append, err_append = oks.append, errs.append
+
+    for res in results:
+        if isinstance(res, Ok):
+            ok_append(res._value)
+        else:
+            err_append(res._value)
+
+    return oks, errs
+
+
+class ResultStats:
+    """
+    Streaming summary of results: counts, error rate, errors grouped by kind and a
+    uniform reservoir sample of `sample_size` `Err` instances
+
+    Error kind is exception class name for exceptions, the error value itself if it's
+    hashable and its class name otherwise. Accumulator is not synchronized, use one per
+    consumer
+    """
+
+    def __init__(self, sample_size: int = 10, *, seed: int | None = None) -> None:
+        self.sample_size = sample_size
+        self.ok_count = 0
+        self.err_count = 0
+        self.errors_by_kind: Counter[Hashable] = Counter()
+        self.samples: list[Err[Any]] = []
+        self._random = random.Random(seed)
+
+    @property
+    def total(self) -> int:
+        return self.ok_count + self.err_count
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Share of `Err` results, `0.0` if nothing was added
+        """
+        total = self.total
+
+        return self.err_count / total if total else 0.0
+
+    def add(self, res: Result[Any, Any]) -> None:
+        if isinstance(res, Ok):
+            self.ok_count += 1
+            return
+
+        self.err_count += 1
+        self.errors_by_kind[_error_kind(res._value)] += 1
+
+        if len(self.samples) < self.sample_size:
+            self.samples.append(res)
+        else:
+            index = self._random.randrange(self.err_count)
+
+            if index < self.sample_size:
+                self.samples[index] = res
+
+    def update(self, results: Iterable[Result[Any, Any]]) -> ResultStats:
+        """
+        Add all results and return the accumulator
+        """
+        add = self.add
+
+        for res in results:
+            add(res)
+
+        return self
+
+    def observe(self, results: Iterable[Result[T, E]]) -> Iterator[Result[T, E]]:
+        """
+        Yield results unchanged while adding them to the accumulator
+        """
+        add = self.add
+
+        for res in results:
+            add(res)
+            yield res
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "ok": self.ok_count,
+            "err": self.err_count,
+            "error_rate": self.error_rate,
+            "errors_by_kind": dict(self.errors_by_kind),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ResultStats total={self.total} ok={self.ok_count} err={self.err_count} "
+            f"error_rate={self.error_rate:.4f}"
+        )
+
+
+def _error_kind(error: Any) -> Hashable:
+    if isinstance(error, BaseException):
+        return error.__class__.__name__
+
+    try:
+        hash(error)
+    except TypeError:
+        return error.__class__.__name__
+
+    return error
+
+
+async def amap_result(
+    results: AsyncIterable[Result[T, E]],
+    func: Callable[[T], Awaitable[S]],
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+    stop_on_err: bool = False,
+) -> AsyncIterator[Result[S, E]]:
+    """
+    Async `fmap` over a stream: applies `(T -> Awaitable[S])` to ok values with up to
+    `concurrency` calls running at once, `Err` items pass through
+
+    Results are yielded in source order if `ordered`, otherwise in completion order
+    If `stop_on_err` the stream ends after the first `Err`, pending calls are cancelled
+    """
+
+    async def apply(value: T) -> Result[S, E]:
+        return Ok(await func(value))
+
+    async for res in _aconcurrent(results, apply, concurrency, ordered, stop_on_err):
+        yield res
+
+
+async def abind_result(
+    results: AsyncIterable[Result[T, E]],
+    func: Callable[[T], Awaitable[Result[S, E]]],
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+    stop_on_err: bool = False,
+) -> AsyncIterator[Result[S, E]]:
+    """
+    Async `bind` over a stream: applies `(T -> Awaitable[Result[S, E]])` to ok values
+    with up to `concurrency` calls running at once, `Err` items pass through
+
+    Results are yielded in source order if `ordered`, otherwise in completion order
+    If `stop_on_err` the stream ends after the first `Err`, pending calls are cancelled
+    """
+    async for res in _aconcurrent(results, func, concurrency, ordered, stop_on_err):
+        yield res
+
+
+async def aiter_ok(results: AsyncIterable[Result[T, E]]) -> AsyncIterator[T]:
+    """
+    Yield ok values of the stream, `Err` items are skipped
+    """
+    async for res in results:
+        if isinstance(res, Ok):
+            yield res._value
+
+
+async def apartition(
+    results: AsyncIterable[Result[T, E]],
+) -> tuple[list[T], list[E]]:
+    """
+    Async `partition_results`
+    """
+    oks: list[T] = []
+    errs: list[E] = []
+
+    async for res in results:
+        if isinstance(res, Ok):
+            oks.append(res._value)
+        else:
+            errs.append(res._value)
+
+    return oks, errs
+
+
+async def achunked(
+    results: AsyncIterable[Result[T, E]], size: int
+) -> AsyncIterator[list[Result[T, E]]]:
+    """
+    Yield lists of `size` results, the last one may be shorter
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be positive")
+
+    chunk: list[Result[T, E]] = []
+
+    async for res in results:
+        chunk.append(res)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+async def _aconcurrent(
+    results: AsyncIterable[Result[T, E]],
+    func: Callable[[T], Awaitable[Result[S, E]]],
+    concurrency: int,
+    ordered: bool,
+    stop_on_err: bool,
+) -> AsyncIterator[Result[S, E]]:
+    if concurrency < 1:
+        raise ValueError("Concurrency must be positive")
+
+    loop = asyncio.get_running_loop()
+    source = aiter(results)
+    pending: deque[asyncio.Future[Result[S, E]]] = deque()
+    exhausted = False
+
+    def schedule(res: Result[T, E]) -> asyncio.Future[Result[S, E]]:
+        if isinstance(res, Ok):
+            return asyncio.ensure_future(func(res._value))
+
+        future: asyncio.Future[Result[S, E]] = loop.create_future()
+        future.set_result(res)
+
+        return future
+
+    try:
+        while True:
+            # At most `concurrency` items are taken from the source and not yielded
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    pending.append(schedule(await anext(source)))
+                except StopAsyncIteration:
+                    exhausted = True
+
+            if not pending:
+                return
+
+            if ordered:
+                res = await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                future = next(f for f in pending if f in done)
+                pending.remove(future)
+                res = future.result()
+
+            yield res
+
+            if stop_on_err and isinstance(res, Err):
+                return
+    finally:
+        for future in pending:
+            future.cancel()
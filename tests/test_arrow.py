@@ -0,0 +1,45 @@
+import pytest
+
+from pyferret.maybe import Just, Nothing
+from pyferret.result import Err, Ok
+
+pa = pytest.importorskip("pyarrow")
+arrow = pytest.importorskip("pyferret.arrow")
+
+
+def test_maybe_to_arrow() -> None:
+    array = arrow.maybe_to_arrow([Just(1), Nothing(), Just(3)])
+
+    assert array.type == pa.int64()
+    assert array.null_count == 1
+    assert array.is_valid().to_pylist() == [True, False, True]
+    assert arrow.maybe_to_arrow([Just(1)], pa.int8()).type == pa.int8()
+
+
+def test_maybe_roundtrip() -> None:
+    items = [Just("a"), Nothing(), Just("c")]
+
+    assert arrow.maybe_from_arrow(arrow.maybe_to_arrow(items)) == items
+    assert arrow.maybe_from_arrow(pa.chunked_array([[1, None], [2]])) == [
+        Just(1),
+        Nothing(),
+        Just(2),
+    ]
+
+
+def test_result_to_arrow() -> None:
+    array = arrow.result_to_arrow([Ok(1.5), Err(ValueError("bad")), Ok(2.0)])
+
+    assert array.type == pa.struct([("ok", pa.float64()), ("err", pa.string())])
+    assert array.field("ok").to_pylist() == [1.5, None, 2.0]
+    assert array.field("err").to_pylist() == [None, "bad", None]
+
+
+def test_result_roundtrip() -> None:
+    items = [Ok(1), Err("bad"), Ok(None), Ok(3)]
+
+    array = arrow.result_to_arrow(items, pa.int32())
+
+    assert array.field("ok").type == pa.int32()
+    assert arrow.result_from_arrow(array) == [Ok(1), Err("bad"), Ok(None), Ok(3)]
+    assert arrow.result_from_arrow(pa.chunked_array([array, array])) == items * 2
@@ -0,0 +1,205 @@
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pyferret.cache import DiskCache, persistent_cache
+from pyferret.maybe import Just, Nothing
+from pyferret.result import Err, Ok, Result
+
+
+def test_persist_across_instances(tmp_path: Path) -> None:
+    calls = []
+
+    def enrich(user_id: int, *, full: bool = False) -> Result[str, str]:
+        calls.append(user_id)
+        return Ok(f"user{user_id}") if user_id else Err("missing")
+
+    cached = persistent_cache(tmp_path / "cache.db")(enrich)
+
+    assert cached(1) == Ok("user1")
+    assert cached(1) == Ok("user1")
+    assert cached(1, full=True) == Ok("user1")
+    assert calls == [1, 1]
+
+    # New process after restart
+    restarted = persistent_cache(tmp_path / "cache.db")(enrich)
+
+    assert restarted(1) == Ok("user1")
+    assert calls == [1, 1]
+    assert restarted.cache.hits == 1
+
+    # Err is not cached by default
+    assert restarted(0) == Err("missing")
+    assert restarted(0) == Err("missing")
+    assert calls == [1, 1, 0, 0]
+
+
+def test_err_policy_and_ttl(tmp_path: Path) -> None:
+    now = [0.0]
+    calls = []
+
+    @persistent_cache(tmp_path / "cache.db", ttl=100, cache_err=True, err_ttl=10)
+    def lookup(key: str) -> Result[str, str]:
+        calls.append(key)
+        return Err("down") if key == "bad" else Ok(key)
+
+    lookup.cache._clock = lambda: now[0]
+
+    lookup("good"), lookup("bad"), lookup("good"), lookup("bad")
+    assert calls == ["good", "bad"]
+
+    now[0] = 50
+    lookup("good"), lookup("bad")
+    assert calls == ["good", "bad", "bad"]
+
+    now[0] = 200
+    lookup("good")
+    assert calls == ["good", "bad", "bad", "good"]
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    now = [0.0]
+    cache = DiskCache(tmp_path / "cache.db", max_entries=3, clock=lambda: now[0])
+
+    for n in range(3):
+        now[0] += 1
+        cache.set(bytes([n]), Just(n))
+
+    now[0] += 1
+    assert cache.get(bytes([0])) == Just(Just(0))
+
+    now[0] += 1
+    cache.set(bytes([3]), Nothing())
+
+    assert len(cache) == 3
+    assert cache.get(bytes([1])) == Nothing()
+    assert cache.get(bytes([0])) == Just(Just(0))
+    assert cache.get(bytes([3])) == Just(Nothing())
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # Unpicklable value is not stored
+    assert not cache.set(b"f", Ok(lambda: 1))
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        DiskCache(tmp_path / "other.db", max_entries=0)
+
+
+def test_entry_count_bookkeeping(tmp_path: Path) -> None:
+    now = [0.0]
+    cache = DiskCache(tmp_path / "cache.db", max_entries=5, clock=lambda: now[0])
+
+    for n in range(3):
+        cache.set(b"same", n)
+        cache.set(bytes([n]), n, ttl=10)
+
+    assert len(cache) == 4
+
+    now[0] = 20
+    cache.set(b"fresh", 1)
+
+    # Expired entries purged on write
+    assert len(cache) == 2
+
+    for n in range(10):
+        now[0] += 1
+        cache.set(bytes([n]), n)
+
+    assert len(cache) == 5
+    assert cache.get(b"same") == Nothing()
+    assert cache.get(bytes([9])) == Just(9)
+
+    conn = cache._connect()
+    assert conn.execute("SELECT count(*) FROM entries").fetchone() == (len(cache),)
+
+
+def test_unpicklable_args_not_cached(tmp_path: Path) -> None:
+    calls = []
+
+    @persistent_cache(tmp_path / "cache.db")
+    def apply(func: object) -> Result[int, str]:
+        calls.append(func)
+        return Ok(1)
+
+    apply(lambda: 1)
+    apply(lambda: 1)
+
+    assert len(calls) == 2
+    assert len(apply.cache) == 0
+
+
+def test_async(tmp_path: Path) -> None:
+    calls = []
+
+    @persistent_cache(tmp_path / "cache.db")
+    async def fetch(n: int) -> Result[int, str]:
+        calls.append(n)
+        await asyncio.sleep(0)
+        return Ok(n)
+
+    async def main() -> list[Result[int, str]]:
+        return [await fetch(1), await fetch(1)]
+
+    assert asyncio.run(main()) == [Ok(1), Ok(1)]
+    assert calls == [1]
+
+
+def test_async_does_not_block_loop(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+
+    @persistent_cache(path)
+    async def fetch(n: int) -> Result[int, str]:
+        return Ok(n)
+
+    # Another process holds the write lock for a while
+    other = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    threading.Timer(0.2, other.rollback).start()
+
+    async def main() -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        assert await fetch(1) == Ok(1)
+        ticker.cancel()
+
+        return ticks
+
+    assert asyncio.run(main()) > 5
+    assert len(fetch.cache) == 1
+
+
+def fill(path: Path, start: int) -> int:
+    cache = DiskCache(path, max_entries=1000)
+
+    for n in range(start, start + 200):
+        cache.set(n.to_bytes(4, "big"), Ok(n))
+        cache.get(max(n - 1, 0).to_bytes(4, "big"))
+
+    return len(cache)
+
+
+def test_multiple_processes(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    DiskCache(path)
+
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(fill, [path] * 4, range(0, 800, 200)))
+
+    cache = DiskCache(path)
+
+    assert len(cache) == 800
+    assert all(cache.get(n.to_bytes(4, "big")) == Just(Ok(n)) for n in range(800))
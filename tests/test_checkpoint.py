@@ -0,0 +1,151 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pyferret.checkpoint import BatchProgress, CheckpointRunner
+from pyferret.result import Err, Ok, Result
+
+
+class CrashError(Exception):
+    pass
+
+
+def test_resume_after_crash(tmp_path: Path) -> None:
+    calls = []
+    crash = [True]
+
+    def pipeline(n: int) -> Result[int, str]:
+        calls.append(n)
+        if n == 7 and crash[0]:
+            raise CrashError
+        return Ok(n * 2) if n % 3 else Err("div3")
+
+    runner = CheckpointRunner(pipeline, tmp_path / "job.ckpt", every=3)
+
+    with pytest.raises(CrashError):
+        runner.run(range(10))
+
+    assert runner.load(10) == {
+        0: Err("div3"),
+        1: Ok(2),
+        2: Ok(4),
+        3: Err("div3"),
+        4: Ok(8),
+        5: Ok(10),
+        6: Err("div3"),
+    }
+
+    calls.clear()
+    crash[0] = False
+    results = runner.run(range(10))
+
+    assert calls == [7, 8, 9]
+    assert results == [Ok(n * 2) if n % 3 else Err("div3") for n in range(10)]
+    assert list(tmp_path.iterdir()) == [tmp_path / "job.ckpt"]
+
+
+def test_retry_errors(tmp_path: Path) -> None:
+    failing = {1, 3}
+
+    def pipeline(n: int) -> Result[int, str]:
+        return Err("down") if n in failing else Ok(n)
+
+    path = tmp_path / "job.ckpt"
+    assert CheckpointRunner(pipeline, path).run(range(5))[1] == Err("down")
+
+    failing.clear()
+    calls = []
+
+    def recovered(n: int) -> Result[int, str]:
+        calls.append(n)
+        return pipeline(n)
+
+    assert CheckpointRunner(recovered, path).run(range(5))[1] == Err("down")
+    assert calls == []
+
+    runner = CheckpointRunner(recovered, path, retry_errors=True)
+
+    assert runner.run(range(5)) == [Ok(n) for n in range(5)]
+    assert calls == [1, 3]
+
+    runner.reset()
+    runner.reset()
+    assert runner.load(5) == {}
+
+
+def test_progress_and_intervals(tmp_path: Path) -> None:
+    now = [0.0]
+    snapshots = []
+
+    def pipeline(n: int) -> Result[int, str]:
+        now[0] += 0.5
+        return Ok(n)
+
+    runner = CheckpointRunner(
+        pipeline,
+        tmp_path / "job.ckpt",
+        every=100,
+        every_seconds=2.0,
+        on_checkpoint=lambda p: snapshots.append(p.to_dict()),
+        clock=lambda: now[0],
+    )
+    runner.run(list(range(10)))
+
+    # Every 4 items by time and once at the end
+    assert [s["done"] for s in snapshots] == [4, 8, 10]
+    assert snapshots[0]["throughput"] == 2.0
+    assert snapshots[0]["eta"] == 3.0
+    assert snapshots[-1]["eta"] == 0.0
+
+    with pytest.raises(ValueError):
+        runner.run(list(range(11)))
+
+
+def test_progress_before_start() -> None:
+    progress = BatchProgress(10, {0: Ok(1), 1: Err("x")}, lambda: 0.0)
+
+    assert (progress.done, progress.errors, progress.eta) == (2, 1, None)
+    assert progress.throughput == 0.0
+
+
+def test_append_log_and_torn_tail(tmp_path: Path) -> None:
+    path = tmp_path / "job.ckpt"
+    sizes = []
+
+    runner = CheckpointRunner(
+        Ok, path, every=10, on_checkpoint=lambda p: sizes.append(path.stat().st_size)
+    )
+    runner.run(range(100))
+
+    # Every checkpoint appends only new outcomes
+    growth = [after - before for before, after in zip(sizes, sizes[1:])]
+    assert len(sizes) == 11
+    assert max(growth[:9]) < 2 * min(growth[:9])
+
+    # Crash while appending leaves a torn record which is ignored
+    with path.open("ab") as file:
+        file.write(b"\x80\x05\x95garbage")
+
+    assert len(runner.load(100)) == 100
+
+    logged = path.stat().st_size
+    runner.run(range(100))
+
+    # Compacted to one record
+    assert path.stat().st_size < logged
+
+
+def test_load_mismatch(tmp_path: Path) -> None:
+    path = tmp_path / "job.ckpt"
+    runner = CheckpointRunner(Ok, path)
+    runner.run(range(3))
+
+    with pytest.raises(ValueError, match="written for 3 items, got 4"):
+        runner.load(4)
+
+    with path.open("wb") as file:
+        pickle.dump({"version": 1, "total": 3, "outcomes": {}}, file)
+
+    with pytest.raises(ValueError, match="format version 1, expected 2"):
+        runner.load(3)
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pyferret.circuit import CircuitBreaker, CircuitOpenError, circuit_breaker
+from pyferret.result import Err, Ok, Result
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_closed_passes_calls(mocker: MockerFixture) -> None:
+    func = mocker.MagicMock(return_value=Ok(1))
+    breaker = CircuitBreaker(func, failure_threshold=2, window=4)
+
+    assert breaker(1, a=2) == Ok(1)
+    func.assert_called_once_with(1, a=2)
+    assert breaker.state == "closed"
+    assert breaker.calls == breaker.successes == 1
+
+
+def test_opens_on_threshold(mocker: MockerFixture) -> None:
+    func = mocker.MagicMock(return_value=Err("down"))
+    breaker = CircuitBreaker(func, failure_threshold=3, window=5, name="db")
+
+    for _ in range(3):
+        assert breaker() == Err("down")
+
+    assert breaker.state == "open"
+
+    first = breaker()
+    second = breaker()
+
+    assert first is second
+    assert isinstance(first.err_value, CircuitOpenError)
+    assert str(first.err_value) == "Circuit 'db' is open"
+    assert func.call_count == 3
+    assert breaker.rejections == 2
+    assert breaker.failures == 3
+
+
+def test_sliding_window_forgets_old_failures() -> None:
+    outcomes: list[Result[int, str]] = [Err("e"), Ok(1), Ok(1), Err("e"), Err("e")]
+    breaker = CircuitBreaker(lambda: outcomes.pop(0), failure_threshold=3, window=3)
+
+    for _ in range(5):
+        breaker()
+
+    assert breaker.window_failures == 2
+    assert breaker.state == "closed"
+
+
+def test_half_open_recovers() -> None:
+    clock = Clock()
+    outcome: list[Result[int, str]] = [Err("e")]
+    breaker = CircuitBreaker(
+        lambda: outcome[0], failure_threshold=1, recovery_timeout=10, clock=clock
+    )
+
+    breaker()
+    assert breaker.state == "open"
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+
+    breaker()
+    assert breaker.state == "open"
+    assert isinstance(breaker().err_value, CircuitOpenError)
+
+    clock.now = 20
+    outcome[0] = Ok(1)
+
+    assert breaker() == Ok(1)
+    assert breaker.state == "closed"
+    assert breaker.window_failures == 0
+
+
+def test_half_open_limits_probes() -> None:
+    clock = Clock()
+    entered, release = threading.Event(), threading.Event()
+    results: list[Result[int, str]] = []
+
+    def slow() -> Result[int, str]:
+        entered.set()
+        release.wait()
+        return Ok(1)
+
+    breaker = CircuitBreaker(slow, failure_threshold=1, recovery_timeout=1, clock=clock)
+    breaker._open()
+    clock.now = 1
+
+    probe = threading.Thread(target=lambda: results.append(breaker()))
+    probe.start()
+    entered.wait()
+
+    assert isinstance(breaker().err_value, CircuitOpenError)
+
+    release.set()
+    probe.join()
+
+    assert results == [Ok(1)]
+    assert breaker.state == "closed"
+
+
+def test_exception_counts_as_failure() -> None:
+    def broken() -> Result[int, str]:
+        raise RuntimeError
+
+    breaker = CircuitBreaker(broken, failure_threshold=1)
+
+    with pytest.raises(RuntimeError):
+        breaker()
+
+    assert breaker.state == "open"
+    assert breaker.failures == 1
+
+
+def test_interrupt_not_counted() -> None:
+    clock = Clock()
+    interrupt: list[BaseException] = [KeyboardInterrupt()]
+
+    def flaky() -> Result[int, str]:
+        if interrupt:
+            error = interrupt.pop()
+            raise error
+        return Ok(1)
+
+    breaker = CircuitBreaker(
+        flaky, failure_threshold=1, recovery_timeout=1, clock=clock
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker()
+
+    assert breaker.state == "closed"
+    assert breaker.calls == 0
+    assert breaker.failures == 0
+
+    breaker._open()
+    clock.now = 1
+    interrupt.append(KeyboardInterrupt())
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker()
+
+    # Probe slot is released, next call probes again
+    assert breaker.state == "half_open"
+    assert breaker() == Ok(1)
+    assert breaker.state == "closed"
+
+
+def test_async_cancellation_not_counted() -> None:
+    clock = Clock()
+
+    async def hang() -> Result[int, str]:
+        await asyncio.Event().wait()
+        return Ok(1)
+
+    breaker = CircuitBreaker(hang, failure_threshold=1, recovery_timeout=1, clock=clock)
+    breaker._open()
+    clock.now = 1
+
+    async def main() -> None:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(breaker(), 0.01)
+
+    asyncio.run(main())
+
+    assert breaker.state == "half_open"
+    assert breaker.failures == 0
+    assert breaker._probes == 0
+
+
+def test_async() -> None:
+    calls = 0
+
+    @circuit_breaker(failure_threshold=2, window=2)
+    async def fetch(x: int) -> Result[int, str]:
+        nonlocal calls
+        calls += 1
+        return Err("down") if x < 0 else Ok(x)
+
+    async def main() -> list[Result[int, str]]:
+        return [await fetch(x) for x in (1, -1, -1, 1)]
+
+    results = asyncio.run(main())
+
+    assert results[:3] == [Ok(1), Err("down"), Err("down")]
+    assert isinstance(results[3].err_value, CircuitOpenError)
+    assert calls == 3
+
+
+def test_reset() -> None:
+    breaker = CircuitBreaker(lambda: Err("e"), failure_threshold=1)
+    breaker()
+
+    breaker.reset()
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 1
+    assert repr(breaker).endswith("closed")
+
+
+def test_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(lambda: Ok(1), failure_threshold=3, window=2)
@@ -0,0 +1,115 @@
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyferret.columnar import SharedResultBatch
+from pyferret.result import Err, Ok
+
+
+def fill_range(batch: SharedResultBatch, start: int, stop: int) -> dict[int, Any]:
+    for index in range(start, stop):
+        if index % 7:
+            batch.set_ok(index, index * 1.5)
+        else:
+            batch.set_err(index, ValueError(index))
+
+    errors = batch.take_errors()
+    batch.close()
+
+    return errors
+
+
+def test_from_results() -> None:
+    results = [Ok(1.0), Err("bad"), Ok(2.5)]
+
+    with SharedResultBatch.from_results(results) as batch:
+        assert len(batch) == 3
+        assert batch.results() == results
+        assert batch.get(1) == Err("bad")
+        assert batch.is_err(1)
+        assert not batch.is_err(0)
+        assert batch.ok_values.tolist()[2] == 2.5
+
+
+def test_set_ok_clears_error() -> None:
+    with SharedResultBatch(2, "q") as batch:
+        batch.set_err(0, "bad")
+        batch.set_ok(0, 10)
+
+        assert batch.results() == [Ok(10), Ok(0)]
+        assert batch.errors == {}
+
+
+def test_pickle_attaches_without_copy() -> None:
+    with SharedResultBatch(4, "i") as batch:
+        attached = pickle.loads(pickle.dumps(batch))
+        attached.set_ok(2, 42)
+        attached.set_err(3, "remote")
+        batch.merge_errors(attached.take_errors())
+        attached.close()
+
+        assert len(pickle.dumps(batch)) < 200
+        assert batch.results() == [Ok(0), Ok(0), Ok(42), Err("remote")]
+
+
+def test_worker_processes() -> None:
+    size, chunk = 1000, 250
+
+    with SharedResultBatch(size) as batch, ProcessPoolExecutor(2) as pool:
+        futures = [
+            pool.submit(fill_range, batch, start, start + chunk)
+            for start in range(0, size, chunk)
+        ]
+
+        for future in futures:
+            batch.merge_errors(future.result())
+
+        results = batch.results()
+
+    assert results[1] == Ok(1.5)
+    assert isinstance(results[7].err_value, ValueError)
+    assert sum(isinstance(r, Err) for r in results) == len(range(0, size, 7))
+    assert all(r == Ok(i * 1.5) for i, r in enumerate(results) if i % 7)
+
+
+def test_invalid_typecode() -> None:
+    with pytest.raises(ValueError):
+        SharedResultBatch(1, "z")
+
+
+def test_tracker_stays_clean() -> None:
+    # Resource tracker reports errors and leaks on stderr of the main process
+    script = """
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pyferret.columnar import SharedResultBatch
+
+def touch(batch):
+    batch.set_ok(0, 1.0)
+    batch.close()
+
+if __name__ == "__main__":
+    with SharedResultBatch(4) as batch:
+        pickle.loads(pickle.dumps(batch)).close()
+
+        with ProcessPoolExecutor(1) as pool:
+            pool.submit(touch, batch).result()
+
+        assert batch.get(0).ok_value == 1.0
+"""
+    done = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")},
+        timeout=60,
+    )
+
+    assert done.returncode == 0, done.stderr
+    assert done.stderr == ""
@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from pyferret.db import write_many
+from pyferret.result import Ok
+
+INSERT = "INSERT INTO users (id, name) VALUES (?, ?)"
+
+
+class CountingCursor(sqlite3.Cursor):
+    calls = 0
+
+    def executemany(self, *args: object) -> sqlite3.Cursor:  # type: ignore[override]
+        CountingCursor.calls += 1
+        return super().executemany(*args)  # type: ignore[arg-type]
+
+
+class CountingConnection(sqlite3.Connection):
+    def cursor(self, *args: object) -> CountingCursor:  # type: ignore[override]
+        return super().cursor(CountingCursor)
+
+
+def connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", factory=CountingConnection)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    return conn
+
+
+def test_all_ok() -> None:
+    conn = connect()
+    rows = [(n, f"user{n}") for n in range(2500)]
+
+    assert write_many(conn, INSERT, rows) == [Ok(row) for row in rows]
+    assert conn.execute("SELECT count(*) FROM users").fetchone() == (2500,)
+
+
+def test_bisect_failing_rows() -> None:
+    conn = connect()
+    rows = [(n, f"user{n}") for n in range(100)]
+    rows[17] = (17, None)
+    rows[80] = (3, "duplicate")
+
+    CountingCursor.calls = 0
+    results = write_many(conn, INSERT, rows, chunk_size=50)
+
+    assert [n for n, res in enumerate(results) if res.is_err] == [17, 80]
+    assert isinstance(results[17].err_value, sqlite3.IntegrityError)
+    assert "UNIQUE" in str(results[80].err_value)
+    assert results[16] == Ok((16, "user16"))
+
+    stored = [row[0] for row in conn.execute("SELECT id FROM users ORDER BY id")]
+    assert stored == [n for n in range(100) if n not in (17, 80)]
+
+    # Two chunks with one bad row each are isolated in about 2 * log2(50) calls
+    assert CountingCursor.calls < 30
+
+
+def test_unexpected_error_reraised() -> None:
+    conn = connect()
+    rows = [(1, "a"), (2, None)]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        write_many(conn, INSERT, rows, errors=(sqlite3.OperationalError,))
+
+    assert conn.execute("SELECT count(*) FROM users").fetchone() == (0,)
+
+    with pytest.raises(ValueError):
+        write_many(conn, INSERT, rows, chunk_size=0)
+
+
+def test_default_errors_are_row_level() -> None:
+    conn = connect()
+    CountingCursor.calls = 0
+
+    with pytest.raises(sqlite3.OperationalError):
+        write_many(conn, "INSERT INTO missing VALUES (?)", [(n,) for n in range(100)])
+
+    # Not bisected
+    assert CountingCursor.calls == 1
+
+    with pytest.raises(TypeError):
+        write_many(object(), INSERT, [])  # type: ignore[arg-type]
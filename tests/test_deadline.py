@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyferret.deadline import (
+    DeadlineExceededError,
+    deadline,
+    guarded,
+    remaining,
+    with_timeout,
+)
+from pyferret.result import Err, Ok, Result
+
+
+def test_with_timeout_sync() -> None:
+    release = threading.Event()
+
+    def slow(x: int) -> Result[int, str]:
+        release.wait()
+        return Ok(x)
+
+    res = with_timeout(slow, 0.01)(1)
+    release.set()
+
+    assert isinstance(res.err_value, TimeoutError)
+    assert with_timeout(slow, 1)(2) == Ok(2)
+
+
+def test_with_timeout_sync_reraises() -> None:
+    def broken() -> Result[int, str]:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        with_timeout(broken, 1)()
+
+
+def test_with_timeout_async() -> None:
+    async def slow(x: int) -> Result[int, str]:
+        await asyncio.sleep(1)
+        return Ok(x)
+
+    async def fast(x: int) -> Result[int, str]:
+        return Ok(x)
+
+    res = asyncio.run(with_timeout(slow, 0.01)(1))
+
+    assert isinstance(res.err_value, TimeoutError)
+    assert asyncio.run(with_timeout(fast, 1)(2)) == Ok(2)
+
+
+def test_deadline_nesting() -> None:
+    assert remaining() is None
+
+    with deadline(10):
+        outer = remaining()
+
+        with deadline(100):
+            assert remaining() <= outer  # type: ignore[operator]
+
+        with deadline(1):
+            assert remaining() <= 1  # type: ignore[operator]
+
+    assert remaining() is None
+
+
+def test_guarded_short_circuits() -> None:
+    calls: list[int] = []
+
+    @guarded
+    def step(x: int) -> Result[int, str]:
+        calls.append(x)
+        return Ok(x + 1)
+
+    assert Ok(1).bind(step) == Ok(2)
+
+    with deadline(0):
+        res = Ok(1).bind(step).bind(step)
+
+    assert isinstance(res.err_value, DeadlineExceededError)
+    assert str(res.err_value) == "Deadline exceeded"
+    assert calls == [1]
+
+
+def test_guarded_async() -> None:
+    @guarded
+    async def step(x: int) -> Result[int, str]:
+        await asyncio.sleep(x)
+        return Ok(x)
+
+    async def main() -> tuple[Result[int, str], ...]:
+        unbounded = await step(0)
+
+        with deadline(0.05):
+            fits = await step(0)
+            cancelled = await step(1)
+            spent = await step(0)
+
+        return unbounded, fits, cancelled, spent
+
+    unbounded, fits, cancelled, spent = asyncio.run(main())
+
+    assert unbounded == fits == Ok(0)
+    assert isinstance(cancelled.err_value, DeadlineExceededError)
+    assert isinstance(spent.err_value, DeadlineExceededError)
+
+
+def test_with_timeout_uses_deadline() -> None:
+    seen: list[float | None] = []
+
+    def step() -> Result[int, str]:
+        seen.append(remaining())
+        time.sleep(0.5)
+        return Ok(1)
+
+    with deadline(0.01):
+        res = with_timeout(step)()
+
+    assert isinstance(res, Err)
+    assert seen[0] is not None
+
+    with deadline(0):
+        assert isinstance(with_timeout(step, 10)().err_value, TimeoutError)
+
+
+def test_with_timeout_async_deadline_spent() -> None:
+    async def step() -> Result[int, str]:
+        return Ok(1)
+
+    async def main() -> Result[int, str]:
+        with deadline(0):
+            return await with_timeout(step)()
+
+    assert isinstance(asyncio.run(main()).err_value, TimeoutError)
@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from pyferret import maybe, result
+from pyferret.diagnostics import trace_allocations
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err, Ok, Result
+from pyferret.step import Step
+
+
+def grow(x: int) -> list[int]:
+    return list(range(x))
+
+
+def lookup(x: int) -> Maybe[int]:
+    return Just(x) if x else Nothing()
+
+
+def check(x: int) -> Result[int, str]:
+    return Ok(x) if x else Err("zero")
+
+
+def test_counts_created_contexts() -> None:
+    with trace_allocations() as report:
+        Just(1).bind(lookup)
+        Just(0).bind(lookup)
+        Ok(1).bind(check).fmap(str)
+        Ok(0).bind(check).fmap(str)
+
+    assert report.created == {"Just": 3, "Nothing": 1, "Ok": 4, "Err": 1}
+
+
+def test_measures_steps() -> None:
+    with trace_allocations() as report:
+        kept = [Ok(1000).fmap(grow) for _ in range(3)]
+        Just(10).fmap_partial(lambda x, y: x + y, 1)
+        Nothing().fmap(grow)
+
+    steps = report.sorted_steps()
+
+    assert steps[0].name == f"{__name__}.grow"
+    assert steps[0].calls == 3
+    assert steps[0].allocated > 3 * 1000 * 8
+    assert steps[0].peak > 1000 * 8
+    assert steps[1].name.endswith("<lambda>")
+    assert steps[1].calls == 1
+    assert len(kept) == 3
+
+
+def fallback() -> Maybe[int]:
+    return Just(0)
+
+
+def retry_check(error: str) -> Result[int, str]:
+    return Ok(len(error))
+
+
+def test_measures_err_side_steps() -> None:
+    with trace_allocations() as report:
+        Err(3).map_err(grow)
+        Err("zero").bind_err(retry_check)
+        Err("zero").or_else(retry_check)
+        Err(3).recover(grow)
+        Nothing().or_else(fallback)
+        Ok(1).map_err(grow)
+
+    assert report.steps[f"{__name__}.grow"].calls == 2
+    assert report.steps[f"{__name__}.retry_check"].calls == 2
+    assert report.steps[f"{__name__}.fallback"].calls == 1
+
+
+def test_measures_step_objects() -> None:
+    with trace_allocations() as report:
+        assert Ok(10).fmap_step(Step(grow)) == Ok(list(range(10)))
+        assert Just(1).bind_step(Step(lookup)) == Just(1)
+        Ok(1).bind_step(Step(check))
+        Just(10).fmap_step(Step(lambda x, y: x * y, 2))
+        Err("zero").fmap_step(Step(grow))
+
+    assert report.steps[f"{__name__}.grow"].calls == 1
+    assert report.steps[f"{__name__}.lookup"].calls == 1
+    assert report.steps[f"{__name__}.check"].calls == 1
+    assert report.steps[f"{__name__}.test_measures_step_objects.<locals>.<lambda>"]
+
+
+def outer(x: int) -> Result[list[int], str]:
+    temp = list(range(x * 10))
+    del temp
+    return Ok(x).fmap(grow)
+
+
+def test_nested_steps() -> None:
+    with trace_allocations() as report:
+        kept = Ok(1000).bind(outer)
+
+    grow_stats = report.steps[f"{__name__}.grow"]
+    outer_stats = report.steps[f"{__name__}.outer"]
+
+    # Bytes retained by nested `grow` are not counted again in `outer`
+    assert grow_stats.allocated > 1000 * 8
+    assert outer_stats.allocated < grow_stats.allocated / 2
+
+    # Peak of `outer` survives peak reset by nested step
+    assert outer_stats.peak > 10000 * 8
+    assert kept.ok_value == list(range(1000))
+
+
+def test_report_output() -> None:
+    with trace_allocations() as report:
+        Ok(10).fmap(grow)
+
+    table = report.table().splitlines()
+    dumped = json.loads(report.to_json())
+
+    assert table[0].split() == ["context", "created"]
+    assert table[3].split() == ["Ok", "2"]
+    assert table[7].split()[:2] == [f"{__name__}.grow", "1"]
+    assert dumped["created"] == {"Just": 0, "Nothing": 0, "Ok": 2, "Err": 0}
+    assert dumped["steps"][0]["function"] == f"{__name__}.grow"
+    assert dumped["steps"][0]["calls"] == 1
+
+
+def test_restores_classes() -> None:
+    originals = {
+        cls: dict(cls.__dict__)
+        for cls in (maybe.Just, maybe.Nothing, result.Ok, result.Err)
+    }
+
+    with pytest.raises(ZeroDivisionError), trace_allocations():
+        Ok(1).fmap(lambda x: x / 0)
+
+    for cls, attrs in originals.items():
+        assert dict(cls.__dict__) == attrs
+
+
+def test_single_active_trace() -> None:
+    with trace_allocations(), pytest.raises(RuntimeError), trace_allocations():
+        pass
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+import pytest
+
+from pyferret.errlog import ErrLogger, log_errs
+from pyferret.result import Err, Ok, Result
+
+LOGGER = "pyferret.tests"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Unrepresentable:
+    def __repr__(self) -> str:
+        raise AssertionError("formatted eagerly")
+
+
+def test_log_structured_record(caplog: pytest.LogCaptureFixture) -> None:
+    err_logger = ErrLogger(LOGGER)
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        assert err_logger.log(Err(ValueError("bad")), source="load") is True
+        assert err_logger.log(Ok(1)) is False
+
+    [record] = caplog.records
+
+    assert record.getMessage() == "Err from load: ValueError: bad"
+    assert record.err_type == "ValueError"  # type: ignore[attr-defined]
+    assert record.err_source == "load"  # type: ignore[attr-defined]
+    assert record.exc_info is None
+    assert err_logger.emitted == 1
+
+
+def test_lazy_formatting(caplog: pytest.LogCaptureFixture) -> None:
+    err_logger = ErrLogger(LOGGER, level=logging.DEBUG)
+
+    with caplog.at_level(logging.INFO, LOGGER):
+        assert err_logger.log(Err(Unrepresentable())) is False
+
+    assert caplog.records == []
+
+
+def test_traceback(caplog: pytest.LogCaptureFixture) -> None:
+    try:
+        raise KeyError("id")
+    except KeyError as exc:
+        error = exc
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        ErrLogger(LOGGER, include_traceback=True).log(Err(error))
+        ErrLogger(LOGGER, include_traceback=True).log(Err("plain"))
+
+    assert caplog.records[0].exc_info == (KeyError, error, error.__traceback__)
+    assert caplog.records[1].getMessage() == "Err 'plain'"
+    assert caplog.records[1].exc_info is None
+
+
+def test_sample_rate(caplog: pytest.LogCaptureFixture) -> None:
+    err_logger = ErrLogger(LOGGER, sample_rate=0.1, seed=1)
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        for _ in range(1000):
+            err_logger.log(Err("e"))
+
+    assert 50 < len(caplog.records) < 150
+    assert err_logger.emitted + err_logger.dropped == 1000
+
+    with pytest.raises(ValueError):
+        ErrLogger(LOGGER, sample_rate=2)
+
+
+def test_rate_limit(caplog: pytest.LogCaptureFixture) -> None:
+    clock = Clock()
+    err_logger = ErrLogger(LOGGER, rate_limit=2, burst=3, clock=clock)
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        emitted = [err_logger.log(Err(n)) for n in range(5)]
+        clock.now = 1.0
+        emitted += [err_logger.log(Err(n)) for n in range(5)]
+
+    assert emitted == [True] * 3 + [False] * 2 + [True] * 2 + [False] * 3
+    assert err_logger.dropped == 5
+
+
+def test_log_errs(caplog: pytest.LogCaptureFixture) -> None:
+    results: list[Result[int, str]] = [Ok(1), Err("a"), Ok(2), Err("b")]
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        assert list(log_errs(results, LOGGER, source="batch")) == results
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "Err from batch: 'a'",
+        "Err from batch: 'b'",
+    ]
+
+
+def test_wrap(caplog: pytest.LogCaptureFixture) -> None:
+    err_logger = ErrLogger(LOGGER)
+
+    @err_logger.wrap
+    def fetch(x: int) -> Result[int, str]:
+        return Ok(x) if x else Err("zero")
+
+    @err_logger.wrap
+    async def afetch(x: int) -> Result[int, str]:
+        return fetch(x)
+
+    with caplog.at_level(logging.WARNING, LOGGER):
+        assert fetch(1) == Ok(1)
+        assert fetch(0) == Err("zero")
+        assert asyncio.run(afetch(1)) == Ok(1)
+        assert asyncio.run(afetch(0)) == Err("zero")
+
+    sources = [r.err_source for r in caplog.records]  # type: ignore[attr-defined]
+
+    assert sources == [
+        f"{__name__}.test_wrap.<locals>.fetch",
+        f"{__name__}.test_wrap.<locals>.fetch",
+        f"{__name__}.test_wrap.<locals>.afetch",
+    ]
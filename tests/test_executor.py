@@ -0,0 +1,186 @@
+import asyncio
+import threading
+
+import pytest
+
+from pyferret.executor import AsyncBoundedExecutor, BoundedExecutor, OverloadedError
+from pyferret.result import Err, Ok, Result
+
+
+def test_results_stream() -> None:
+    with BoundedExecutor[int, str](2) as executor:
+
+        def produce() -> None:
+            for n in range(10):
+                executor.submit(lambda n=n: Ok(n) if n % 2 else Err("odd"))
+
+            executor.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        results = list(executor.results())
+        producer.join()
+
+    assert sorted(r.ok_value for r in results if isinstance(r, Ok)) == [1, 3, 5, 7, 9]
+    assert results.count(Err("odd")) == 5
+    assert executor.in_flight == 0
+
+
+def test_reject_when_full() -> None:
+    release = threading.Event()
+
+    def task() -> Result[int, str]:
+        release.wait()
+        return Ok(1)
+
+    executor = BoundedExecutor[int, str](2, block=False)
+
+    assert executor.submit(task) == Ok(None)
+    assert executor.submit(task) == Ok(None)
+
+    rejected = executor.submit(task)
+
+    assert isinstance(rejected.err_value, OverloadedError)
+    assert str(rejected.err_value) == "Executor is overloaded"
+
+    release.set()
+    executor.close()
+
+    assert list(executor.results()) == [Ok(1), Ok(1)]
+
+
+def test_block_with_timeout() -> None:
+    executor = BoundedExecutor[int, str](1, timeout=0.01)
+    executor.submit(lambda: Ok(1))
+
+    # Slot is released only when result is consumed
+    assert isinstance(executor.submit(lambda: Ok(2)).err_value, OverloadedError)
+
+    results = executor.results()
+    assert next(results) == Ok(1)
+    assert executor.submit(lambda: Ok(2)) == Ok(None)
+    assert next(results) == Ok(2)
+
+    executor.close()
+    assert list(results) == []
+
+
+def test_per_key_limit() -> None:
+    release = threading.Event()
+
+    def task() -> Result[str, str]:
+        release.wait()
+        return Ok("hot")
+
+    executor = BoundedExecutor[str, str](10, max_per_key=1, block=False)
+
+    assert executor.submit(task, key="hot") == Ok(None)
+
+    rejected = executor.submit(task, key="hot")
+
+    assert rejected.err_value.key == "hot"
+    assert str(rejected.err_value) == "Executor is overloaded for key 'hot'"
+    assert executor.submit(lambda: Ok("cold"), key="cold") == Ok(None)
+    assert next(executor.results()) == Ok("cold")
+
+    release.set()
+    executor.close()
+
+    assert list(executor.results()) == [Ok("hot")]
+
+
+def test_exception_as_err() -> None:
+    error = RuntimeError("boom")
+
+    def task() -> Result[int, str]:
+        raise error
+
+    executor = BoundedExecutor[int, str](1)
+    executor.submit(task)
+    executor.close()
+
+    assert list(executor.results()) == [Err(error)]
+
+    with pytest.raises(RuntimeError):
+        executor.submit(task)
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        BoundedExecutor(0)
+
+    with pytest.raises(ValueError):
+        AsyncBoundedExecutor(1, max_per_key=0)
+
+
+def test_async_executor() -> None:
+    async def task(n: int) -> Result[int, str]:
+        await asyncio.sleep(0)
+        return Ok(n)
+
+    async def main() -> list[Result[int, str]]:
+        async with AsyncBoundedExecutor[int, str](3) as executor:
+
+            async def produce() -> None:
+                for n in range(10):
+                    await executor.submit(lambda n=n: task(n))
+
+                await executor.close()
+
+            producer = asyncio.create_task(produce())
+            results = [res async for res in executor.results()]
+            await producer
+
+        return results
+
+    results = asyncio.run(main())
+
+    assert sorted(r.ok_value for r in results) == list(range(10))
+
+
+def test_async_reject_and_per_key() -> None:
+    async def main() -> None:
+        release = asyncio.Event()
+
+        async def task() -> Result[int, str]:
+            await release.wait()
+            return Ok(1)
+
+        executor = AsyncBoundedExecutor[int, str](2, max_per_key=1, block=False)
+
+        assert await executor.submit(task, key="a") == Ok(None)
+        assert (await executor.submit(task, key="a")).err_value.key == "a"
+        assert await executor.submit(task, key="b") == Ok(None)
+        assert (await executor.submit(task)).err_value.key is None
+
+        timed = AsyncBoundedExecutor[int, str](1, timeout=0.01)
+        await timed.submit(task)
+        assert isinstance((await timed.submit(task)).err_value, OverloadedError)
+
+        release.set()
+        await executor.close()
+        await timed.close()
+
+        assert [res async for res in executor.results()] == [Ok(1), Ok(1)]
+        assert [res async for res in timed.results()] == [Ok(1)]
+
+    asyncio.run(main())
+
+
+def test_async_exception_as_err() -> None:
+    error = RuntimeError("boom")
+
+    async def task() -> Result[int, str]:
+        raise error
+
+    async def main() -> list[Result[int, str]]:
+        executor = AsyncBoundedExecutor[int, str](1)
+        await executor.submit(task)
+        await executor.close()
+
+        with pytest.raises(RuntimeError):
+            await executor.submit(task)
+
+        return [res async for res in executor.results()]
+
+    assert asyncio.run(main()) == [Err(error)]
@@ -1,5 +1,17 @@
-from pyferret.helpers import concat, from_optional
+from decimal import Decimal
+
+import pytest
+
+from pyferret.helpers import (
+    concat,
+    err_many,
+    from_optional,
+    from_optional_many,
+    ok_many,
+    optional_mask,
+)
 from pyferret.maybe import Just, Nothing
+from pyferret.result import Err, Ok
 
 
 def test_concat() -> None:
@@ -12,3 +24,66 @@ def test_from_optional() -> None:
     assert from_optional(None) == Nothing()
     assert from_optional(1) == Just(1)
     assert from_optional(1)._value == 1
+
+
+def test_from_optional_many() -> None:
+    values = [1, None, 0, None, "a"]
+
+    maybes = from_optional_many(values)
+
+    assert maybes == [from_optional(value) for value in values]
+    assert maybes[1] is maybes[3]
+    assert from_optional_many(iter(values)) == maybes
+    assert from_optional_many([]) == []
+
+
+def test_optional_mask() -> None:
+    assert optional_mask((1, None, 0)) == ([1, None, 0], [True, False, True])
+    assert optional_mask(iter([None])) == ([None], [False])
+
+
+def test_numpy_input() -> None:
+    np = pytest.importorskip("numpy")
+    values = np.array([1, None, 3], dtype=object)
+
+    assert from_optional_many(values) == [Just(1), Nothing(), Just(3)]
+    assert optional_mask(values) == ([1, None, 3], [True, False, True])
+    assert ok_many(np.arange(3)) == [Ok(0), Ok(1), Ok(2)]
+
+
+def test_ok_many() -> None:
+    values: list[object] = [1, 1, True, [1], [1]]
+
+    plain = ok_many(values)
+
+    assert plain == [Ok(value) for value in values]
+    assert plain[0] is not plain[1]
+
+    oks = ok_many(values, intern=True)
+
+    assert oks == [Ok(value) for value in values]
+    assert oks[0] is oks[1]
+    assert oks[2] is not oks[0]
+    assert oks[2].ok_value is True
+    assert oks[3] is not oks[4]
+
+
+def test_err_many() -> None:
+    plain = err_many(["timeout", "timeout"])
+
+    assert plain[0] is not plain[1]
+
+    errs = err_many(("timeout", "timeout", "refused"), intern=True)
+
+    assert errs == [Err("timeout"), Err("timeout"), Err("refused")]
+    assert errs[0] is errs[1]
+
+
+def test_many_keeps_equal_distinct_values() -> None:
+    zeros = ok_many([0.0, -0.0], intern=True)
+    tuples = ok_many([(1,), (1.0,)], intern=True)
+    decimals = err_many([Decimal("1.0"), Decimal("1.00")], intern=True)
+
+    assert str(zeros[1].ok_value) == "-0.0"
+    assert isinstance(tuples[1].ok_value[0], float)
+    assert str(decimals[1].err_value) == "1.00"
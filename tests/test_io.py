@@ -0,0 +1,204 @@
+import io
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import pytest
+
+from pyferret.io import (
+    ParseError,
+    iter_fixed_records,
+    iter_length_prefixed,
+    read_csv,
+    read_mapped,
+    read_ndjson,
+    window,
+)
+from pyferret.maybe import Just, Nothing
+from pyferret.result import Err, Ok
+
+NDJSON = b'{"a": 1}\n\n{"a": 2}\r\n{broken\n[3]'
+
+
+def test_read_ndjson_bytes() -> None:
+    results = list(read_ndjson(NDJSON))
+
+    assert results[0] == Ok({"a": 1})
+    assert results[1] == Ok({"a": 2})
+    assert isinstance(results[2], Err)
+    assert results[3] == Ok([3])
+    assert len(results) == 4
+
+
+def test_read_ndjson_parse_error_position() -> None:
+    err = list(read_ndjson(NDJSON))[2].err_value
+
+    assert isinstance(err, ParseError)
+    assert err.line_no == 4
+    assert err.offset == NDJSON.index(b"{broken")
+    assert isinstance(err.exc, json.JSONDecodeError)
+    assert str(err).startswith("line 4 (offset 20):")
+
+
+def test_read_ndjson_small_blocks() -> None:
+    data = b"".join(json.dumps({"n": n}).encode() + b"\n" for n in range(100))
+
+    results = list(read_ndjson(data, block_size=7))
+
+    assert results == [Ok({"n": n}) for n in range(100)]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 8, 13, 1024])
+def test_read_ndjson_chunk_boundaries(block_size: int) -> None:
+    expected = [
+        (r.err_value.line_no, r.err_value.offset) if isinstance(r, Err) else r
+        for r in read_ndjson(NDJSON)
+    ]
+    results = [
+        (r.err_value.line_no, r.err_value.offset) if isinstance(r, Err) else r
+        for r in read_ndjson(io.BytesIO(NDJSON), block_size=block_size)
+    ]
+
+    assert results == expected
+
+
+def test_read_ndjson_sources(tmp_path: Path) -> None:
+    path = tmp_path / "data.ndjson"
+    path.write_bytes(NDJSON)
+    expected = [r.get_ok_or(None) for r in read_ndjson(NDJSON)]
+
+    with path.open("rb") as file:
+        from_file = [r.get_ok_or(None) for r in read_ndjson(file, block_size=5)]
+
+    with path.open("rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        from_mmap = [r.get_ok_or(None) for r in read_ndjson(mapped, block_size=5)]
+
+    from_path = [r.get_ok_or(None) for r in read_ndjson(str(path), block_size=3)]
+
+    assert from_file == from_mmap == from_path == expected
+
+
+def test_read_ndjson_is_lazy() -> None:
+    results = read_ndjson(b'{"a": 1}\n{broken')
+
+    assert next(results) == Ok({"a": 1})
+    assert isinstance(next(results), Err)
+
+
+def test_read_ndjson_workers() -> None:
+    data = b"".join(
+        (b"{bad}" if n % 10 == 0 else json.dumps(n).encode()) + b"\n"
+        for n in range(500)
+    )
+
+    serial = list(read_ndjson(data, block_size=64))
+    parallel = list(read_ndjson(data, block_size=64, workers=2))
+
+    assert [r.get_ok_or(None) for r in parallel] == [r.get_ok_or(None) for r in serial]
+    assert [r.err_value.line_no for r in parallel if isinstance(r, Err)] == list(
+        range(1, 501, 10)
+    )
+
+
+def test_read_csv() -> None:
+    data = b'a,b\n1,"x,y"\n2,"broken"z\n'
+
+    results = list(read_csv(data, dialect="unix"))
+
+    assert results[0] == Ok(["a", "b"])
+    assert results[1] == Ok(["1", "x,y"])
+    assert results[2] == Ok(["2", "brokenz"])
+
+
+def test_read_csv_header() -> None:
+    data = b"\nid,name\n1,foo\n2\n3,bar\n"
+
+    results = list(read_csv(data, header=True, block_size=4))
+
+    assert results[0] == Ok({"id": "1", "name": "foo"})
+    assert isinstance(results[1], Err)
+    assert results[1].err_value.line_no == 4
+    assert results[1].err_value.offset == data.index(b"2\n")
+    assert results[2] == Ok({"id": "3", "name": "bar"})
+    assert len(results) == 3
+
+
+def test_read_csv_header_workers() -> None:
+    data = b"id\n" + b"".join(f"{n}\n".encode() for n in range(200))
+
+    results = list(read_csv(data, header=True, block_size=32, workers=2))
+
+    assert results == [Ok({"id": str(n)}) for n in range(200)]
+
+
+def test_read_csv_decode_error() -> None:
+    results = list(read_csv(b"ok\n\xff\xfe\n"))
+
+    assert results[0] == Ok(["ok"])
+    assert isinstance(results[1].err_value.exc, UnicodeDecodeError)
+
+
+def test_read_mapped(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abcdef")
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    view = read_mapped(path).ok_value
+
+    assert view.readonly
+    assert bytes(view[1:3]) == b"bc"
+    assert read_mapped(empty) == Ok(memoryview(b""))
+    assert isinstance(read_mapped(tmp_path / "missing").err_value, FileNotFoundError)
+
+
+def test_window() -> None:
+    view = memoryview(b"abcdef")
+
+    assert window(view, 2, 3).fmap(bytes) == Just(b"cde")
+    assert window(view, 0, 6).fmap(bytes) == Just(b"abcdef")
+    assert window(view, 4, 3) == Nothing()
+    assert window(view, -1, 1) == Nothing()
+    assert window(view, 0, -1) == Nothing()
+
+
+def test_iter_fixed_records() -> None:
+    data = bytearray(b"aabbc")
+    results = list(iter_fixed_records(memoryview(data), 2))
+
+    assert [bytes(r.ok_value) for r in results[:2]] == [b"aa", b"bb"]
+    assert results[2].err_value.offset == 4
+    assert str(results[2].err_value) == "offset 4: Truncated record: 1 of 2 bytes"
+
+    data[0:1] = b"z"
+    assert bytes(results[0].ok_value) == b"za"
+
+    assert list(iter_fixed_records(memoryview(b"aabb"), 2))[-1].is_ok
+
+    with pytest.raises(ValueError):
+        list(iter_fixed_records(memoryview(b""), 0))
+
+
+def test_iter_length_prefixed() -> None:
+    data = b"".join(struct.pack("<H", len(p)) + p for p in (b"one", b"", b"three"))
+
+    results = list(iter_length_prefixed(memoryview(data), "<H"))
+
+    assert [bytes(r.ok_value) for r in results] == [b"one", b"", b"three"]
+
+
+def test_iter_length_prefixed_broken() -> None:
+    data = struct.pack("<I", 3) + b"abc" + struct.pack("<I", 10) + b"short"
+
+    results = list(iter_length_prefixed(memoryview(data)))
+
+    assert bytes(results[0].ok_value) == b"abc"
+    assert results[1].err_value.offset == 7
+    assert len(results) == 2
+
+    truncated = list(iter_length_prefixed(memoryview(b"\x01")))
+
+    assert str(truncated[0].err_value) == "offset 0: Truncated length prefix"
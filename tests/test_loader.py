@@ -0,0 +1,204 @@
+import asyncio
+import threading
+
+import pytest
+
+from pyferret.loader import AsyncBatchLoader, BatchLoader
+from pyferret.maybe import Just, Nothing
+
+USERS = {1: "alice", 2: "bob", 3: None}
+
+
+def test_coalesce_and_dedupe() -> None:
+    calls = []
+
+    def bulk(keys: list[int]) -> dict[int, str | None]:
+        calls.append(keys)
+        return {key: USERS[key] for key in keys if key in USERS}
+
+    loader = BatchLoader(bulk, window=0.01)
+    futures = loader.load_many([1, 2, 1, 3, 4])
+
+    assert [f.result() for f in futures] == [
+        Just("alice"),
+        Just("bob"),
+        Just("alice"),
+        Nothing(),
+        Nothing(),
+    ]
+    assert calls == [[1, 2, 3, 4]]
+    assert loader.batches == 1
+
+    # Cached
+    assert loader.load(2).result() == Just("bob")
+    assert loader.batches == 1
+
+    loader.clear(2)
+    assert loader.load(2).result() == Just("bob")
+    assert calls[-1] == [2]
+
+
+def test_max_batch_size_and_dispatch() -> None:
+    calls = []
+
+    def bulk(keys: list[int]) -> dict[int, int]:
+        calls.append(keys)
+        return {key: key * 10 for key in keys}
+
+    loader = BatchLoader(bulk, window=60, max_batch_size=2, cache=False)
+    first, second, third = loader.load_many([1, 2, 3])
+
+    assert first.done() and second.done()
+    assert not third.done()
+
+    loader.dispatch()
+
+    assert third.result() == Just(30)
+    assert calls == [[1, 2], [3]]
+
+    loader.prime(5, 50)
+    assert loader.load(5).result() == Just(50)
+
+
+def test_concurrent_loads() -> None:
+    calls = []
+
+    def bulk(keys: list[int]) -> dict[int, int]:
+        calls.append(sorted(keys))
+        return {key: key for key in keys}
+
+    loader = BatchLoader(bulk, window=0.05)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        results[n] = loader.load(n % 4).result()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {n: Just(n % 4) for n in range(8)}
+    assert calls == [[0, 1, 2, 3]]
+
+
+def test_bulk_error_not_cached() -> None:
+    fail = [True]
+
+    def bulk(keys: list[int]) -> dict[int, int]:
+        if fail.pop():
+            raise ConnectionError("down")
+        return {key: key for key in keys}
+
+    loader = BatchLoader(bulk, window=0)
+
+    with pytest.raises(ConnectionError):
+        loader.load(1).result()
+
+    fail.append(False)
+    assert loader.load(1).result() == Just(1)
+
+
+def test_async_loader_tick() -> None:
+    calls = []
+
+    async def bulk(keys: list[int]) -> dict[int, str | None]:
+        calls.append(keys)
+        await asyncio.sleep(0)
+        return {key: USERS[key] for key in keys if key in USERS}
+
+    async def main() -> None:
+        loader = AsyncBatchLoader(bulk)
+
+        async def name(user_id: int) -> str:
+            return (await loader.load(user_id)).fmap(str.title).get_value_or("?")
+
+        assert await asyncio.gather(*(name(n) for n in [1, 2, 3, 1, 4])) == [
+            "Alice",
+            "Bob",
+            "?",
+            "Alice",
+            "?",
+        ]
+        assert calls == [[1, 2, 3, 4]]
+
+        assert await loader.load_many([2, 5]) == [Just("bob"), Nothing()]
+        assert calls[-1] == [5]
+
+        loader.prime(6, "carol")
+        assert await loader.load(6) == Just("carol")
+
+    asyncio.run(main())
+
+
+def test_async_window_and_error() -> None:
+    calls = []
+
+    async def bulk(keys: list[int]) -> dict[int, int]:
+        calls.append(keys)
+        if 0 in keys:
+            raise ConnectionError("down")
+        return {key: key for key in keys}
+
+    async def main() -> None:
+        loader = AsyncBatchLoader(bulk, window=0.01, max_batch_size=3)
+        first = loader.load(1)
+        await asyncio.sleep(0)
+        second = loader.load(2)
+
+        assert await first == Just(1)
+        assert await second == Just(2)
+        assert calls == [[1, 2]]
+
+        with pytest.raises(ConnectionError):
+            await loader.load(0)
+
+        assert 0 not in loader._cache
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_waiter() -> None:
+    calls = []
+
+    async def bulk(keys: list[int]) -> dict[int, int]:
+        calls.append(keys)
+        await asyncio.sleep(0.05)
+        return {key: key for key in keys}
+
+    async def main() -> None:
+        loader = AsyncBatchLoader(bulk)
+        other = loader.load(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(loader.load(1), 0.01)
+
+        assert await other == Just(1)
+        assert await loader.load(1) == Just(1)
+        assert calls == [[1]]
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_batch_not_cached() -> None:
+    async def bulk(keys: list[int]) -> dict[int, int]:
+        await asyncio.sleep(10)
+        return {}
+
+    async def main() -> None:
+        loader = AsyncBatchLoader(bulk)
+        waiter = loader.load(1)
+        await asyncio.sleep(0.01)
+
+        for task in loader._tasks:
+            task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert loader._cache == {}
+
+    asyncio.run(main())
@@ -3,6 +3,7 @@ from pytest_mock import MockerFixture
 
 from pyferret import result
 from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.step import Step
 
 
 def test_just_init() -> None:
@@ -255,3 +256,32 @@ def test_hash() -> None:
 def test_repr() -> None:
     assert repr(Just(1)) == "Just 1"
     assert repr(Nothing()) == "Nothing"
+
+
+def test_fmap_step(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=30)
+    step = Step(foo, 2, y=3)
+
+    assert Just(1).fmap_step(step) == Just(30)
+    assert Nothing().fmap_step(step) == Nothing()
+    foo.assert_called_once_with(1, 2, y=3)
+
+
+def test_bind_step(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=Nothing())
+    step = Step(foo, 2)
+
+    assert Just(1).bind_step(step) == Nothing()
+    assert Nothing().bind_step(step) == Nothing()
+    foo.assert_called_once_with(1, 2)
+
+
+def test_or_else(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=Just(2))
+
+    just_val = Just(1)
+
+    assert just_val.or_else(foo) is just_val
+    assert Nothing().or_else(foo) == Just(2)
+    assert Nothing().or_else(Nothing) == Nothing()
+    foo.assert_called_once_with()
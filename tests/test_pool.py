@@ -0,0 +1,278 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from pyferret.pool import AsyncPool, Pool, PoolError
+from pyferret.result import Ok, Result
+
+
+def connect() -> sqlite3.Connection:
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+def is_open(conn: sqlite3.Connection) -> bool:
+    conn.execute("SELECT 1")
+    return True
+
+
+def query(conn: sqlite3.Connection) -> Result[int, str]:
+    return Ok(conn.execute("SELECT 41 + 1").fetchone()[0])
+
+
+def test_acquire_and_reuse() -> None:
+    with Pool(connect, max_size=2, dispose=sqlite3.Connection.close) as pool:
+        first = pool.acquire().ok_value
+        second = pool.acquire().ok_value
+
+        assert (pool.size, pool.in_use, pool.idle) == (2, 2, 0)
+
+        first.release()
+        first.release()
+
+        assert (pool.size, pool.in_use, pool.idle) == (2, 1, 1)
+        assert pool.acquire().ok_value.resource is first.resource
+        assert isinstance(pool.acquire(timeout=0).err_value, PoolError)
+
+        second.release()
+        assert pool.use(query) == Ok(42)
+        assert pool.created == 2
+
+
+def test_timeout() -> None:
+    pool = Pool(connect, max_size=1, timeout=0.01)
+    lease = pool.acquire().ok_value
+
+    error = pool.acquire().err_value
+    assert error.reason == "timeout"
+    assert str(error) == "Timed out waiting for a pool resource"
+
+    threading.Timer(0.01, lease.release).start()
+    assert pool.acquire(timeout=5).is_ok
+
+
+def test_use() -> None:
+    pool = Pool(connect, max_size=1)
+
+    assert pool.use(query) == Ok(42)
+    assert (pool.size, pool.idle) == (1, 1)
+
+    def broken(conn: sqlite3.Connection) -> Result[int, str]:
+        conn.execute("SELECT * FROM missing")
+        return Ok(1)
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.use(broken)
+
+    # Resource which raised is evicted
+    assert (pool.size, pool.evicted) == (0, 1)
+    assert pool.use(query) == Ok(42)
+
+
+def test_validate_on_borrow() -> None:
+    closed = []
+    pool = Pool(connect, validate=is_open, dispose=closed.append)
+
+    with pool.acquire().ok_value as conn:
+        conn.close()
+
+    assert pool.idle == 1
+
+    lease = pool.acquire().ok_value
+
+    assert lease.resource is not conn
+    assert closed == [conn]
+    assert (pool.size, pool.evicted, pool.created) == (1, 1, 2)
+
+    lease.invalidate()
+    assert (pool.size, pool.evicted, closed[-1]) == (0, 2, lease.resource)
+
+
+def test_create_error_and_close() -> None:
+    def factory() -> sqlite3.Connection:
+        raise sqlite3.OperationalError("unable to open database file")
+
+    pool = Pool(factory, max_size=1)
+    error = pool.acquire().err_value
+
+    assert error.reason == "create"
+    assert isinstance(error.__cause__, sqlite3.OperationalError)
+    assert (pool.size, pool.in_use, pool.created) == (0, 0, 0)
+
+    closed = []
+    pool = Pool(connect, dispose=closed.append)
+    idle, leased = pool.acquire().ok_value, pool.acquire().ok_value
+    idle.release()
+    pool.close()
+
+    assert closed == [idle.resource]
+    assert pool.acquire().err_value.reason == "closed"
+    assert str(pool.acquire().err_value) == "Pool is closed"
+
+    leased.release()
+    assert closed == [idle.resource, leased.resource]
+    assert pool.size == 0
+
+    with pytest.raises(ValueError):
+        Pool(connect, max_size=0)
+
+
+def test_threads() -> None:
+    pool = Pool(connect, max_size=3, timeout=5)
+    seen = []
+
+    def worker() -> None:
+        for _ in range(20):
+            seen.append(pool.use(query))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == [Ok(42)] * 160
+    assert pool.size <= 3
+    assert pool.in_use == 0
+
+
+def test_async_pool() -> None:
+    async def factory() -> sqlite3.Connection:
+        return connect()
+
+    async def validate(conn: sqlite3.Connection) -> bool:
+        return is_open(conn)
+
+    async def dispose(conn: sqlite3.Connection) -> None:
+        conn.close()
+
+    async def aquery(conn: sqlite3.Connection) -> Result[int, str]:
+        await asyncio.sleep(0.001)
+        return query(conn)
+
+    async def main() -> None:
+        async with AsyncPool(
+            factory, max_size=2, timeout=0.01, validate=validate, dispose=dispose
+        ) as pool:
+            results = await asyncio.gather(*(pool.use(aquery) for _ in range(10)))
+
+            assert results == [Ok(42)] * 10
+            assert pool.created == 2
+
+            first = (await pool.acquire()).ok_value
+            second = (await pool.acquire()).ok_value
+            assert (await pool.acquire()).err_value.reason == "timeout"
+
+            first.resource.close()
+            await first.release()
+            await second.invalidate()
+
+            async with (await pool.acquire()).ok_value as conn:
+                assert is_open(conn)
+
+            assert (pool.size, pool.evicted) == (1, 2)
+
+        assert (await pool.acquire()).err_value.reason == "closed"
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_acquire_returns_slot() -> None:
+    async def slow_factory() -> sqlite3.Connection:
+        await asyncio.sleep(1)
+        return connect()
+
+    async def factory() -> sqlite3.Connection:
+        return connect()
+
+    async def slow_validate(conn: sqlite3.Connection) -> bool:
+        await asyncio.sleep(1)
+        return True
+
+    async def main() -> None:
+        pool = AsyncPool(slow_factory, max_size=1, timeout=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.acquire(), 0.01)
+
+        assert (pool.size, pool.in_use, pool.created) == (0, 0, 0)
+
+        pool = AsyncPool(factory, max_size=1, validate=slow_validate)
+        await (await pool.acquire()).ok_value.release()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.acquire(), 0.01)
+
+        # Resource which validation was interrupted stays in the pool
+        assert (pool.size, pool.in_use, pool.idle) == (1, 0, 1)
+
+    asyncio.run(main())
+
+
+def test_interrupted_factory_returns_slot() -> None:
+    def factory() -> sqlite3.Connection:
+        raise KeyboardInterrupt
+
+    pool = Pool(factory, max_size=1)
+
+    with pytest.raises(KeyboardInterrupt):
+        pool.acquire()
+
+    assert (pool.size, pool.in_use) == (0, 0)
+
+
+def test_zero_timeout_with_free_slot() -> None:
+    async def factory() -> sqlite3.Connection:
+        return connect()
+
+    async def main() -> None:
+        pool = AsyncPool(factory, max_size=2)
+
+        assert (await pool.acquire(timeout=0)).is_ok
+        assert Pool(connect, max_size=2).acquire(timeout=0).is_ok
+
+    asyncio.run(main())
+
+
+def test_closed_during_validation_disposes() -> None:
+    closed: list[sqlite3.Connection] = []
+
+    def validate(conn: sqlite3.Connection) -> bool:
+        pool.close()
+        raise KeyboardInterrupt
+
+    pool = Pool(connect, validate=validate, dispose=closed.append)
+    pool.acquire().ok_value.release()
+
+    with pytest.raises(KeyboardInterrupt):
+        pool.acquire()
+
+    assert len(closed) == 1
+    assert pool.size == 0
+
+    async def afactory() -> sqlite3.Connection:
+        return connect()
+
+    async def avalidate(conn: sqlite3.Connection) -> bool:
+        await apool.close()
+        await asyncio.sleep(1)
+        return True
+
+    async def adispose(conn: sqlite3.Connection) -> None:
+        closed.append(conn)
+
+    apool = AsyncPool(afactory, validate=avalidate, dispose=adispose)
+
+    async def main() -> None:
+        await (await apool.acquire()).ok_value.release()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(apool.acquire(), 0.01)
+
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+
+    assert len(closed) == 2
+    assert apool.size == 0
@@ -0,0 +1,92 @@
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.reactive import Input, combine, update
+from pyferret.result import Err, Ok, Result
+
+
+def positive(x: int) -> Result[int, str]:
+    return Ok(x) if x > 0 else Err("not positive")
+
+
+def test_fmap_and_bind() -> None:
+    price = Input(Ok(10))
+    taxed = price.fmap(lambda x: x * 2)
+    checked = taxed.bind(positive)
+
+    assert taxed.value == Ok(20)
+    assert checked.value == Ok(20)
+
+    price.set(Ok(-1))
+
+    assert taxed.value == Ok(-2)
+    assert checked.value == Err("not positive")
+    assert repr(checked) == "Cell Err 'not positive'"
+
+
+def test_unchanged_values_stop_propagation() -> None:
+    x = Input(Ok(3))
+    parity = x.fmap(lambda v: v % 2)
+    label = parity.fmap(lambda v: "odd" if v else "even")
+
+    x.set(Ok(5))
+
+    assert label.value == Ok("odd")
+    assert parity.computations == 2
+    assert label.computations == 1
+
+    x.set(Ok(5))
+
+    assert parity.computations == 2
+
+
+def test_failure_propagates_without_calls() -> None:
+    calls: list[int] = []
+    x: Input[int] = Input(Just(1))
+    y = x.fmap(lambda v: calls.append(v) or v)
+    z = y.fmap(lambda v: calls.append(v) or v)
+
+    x.set(Nothing())
+
+    assert z.value == Nothing()
+    assert calls == [1, 1]
+
+    x.set(Just(2))
+
+    assert z.value == Just(2)
+    assert calls == [1, 1, 2, 2]
+
+
+def test_combine_recomputes_once() -> None:
+    calls: list[tuple[int, int]] = []
+
+    def total(a: int, b: int) -> Maybe[int]:
+        calls.append((a, b))
+        return Just(a + b)
+
+    a, b = Input(Just(1)), Input(Just(2))
+    a_double = a.fmap(lambda v: v * 2)
+    summed = combine(total, a_double, b)
+    shared = combine(lambda s, v: Just(s - v), summed, a)
+
+    assert summed.value == Just(4)
+    assert shared.value == Just(3)
+
+    update({a: Just(10), b: Just(5)})
+
+    assert summed.value == Just(25)
+    assert shared.value == Just(15)
+    assert calls == [(2, 2), (20, 5)]
+    assert shared.computations == 2
+
+
+def test_combine_short_circuits() -> None:
+    a, b = Input(Ok(1)), Input(Err("missing"))
+    summed = combine(lambda x, y: Ok(x + y), a, b)
+
+    assert summed.value == Err("missing")
+
+    b.set(Ok(2))
+    assert summed.value == Ok(3)
+
+    a.set(Err("broken"))
+    assert summed.value == Err("broken")
+    assert summed.computations == 3
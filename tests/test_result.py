@@ -3,6 +3,7 @@ from pytest_mock import MockerFixture
 
 from pyferret import maybe
 from pyferret.result import Err, Ok, Result
+from pyferret.step import Step
 
 
 def test_ok_init() -> None:
@@ -284,3 +285,78 @@ def test_exception_support() -> None:
 def test_repr() -> None:
     assert repr(Ok(1)) == "Ok 1"
     assert repr(Err("nana")) == "Err 'nana'"
+
+
+def test_fmap_step(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=30)
+    step = Step(foo, 2, y=3)
+
+    assert Ok(1).fmap_step(step) == Ok(30)
+    assert Err("200").fmap_step(step) == Err("200")
+    foo.assert_called_once_with(1, 2, y=3)
+
+
+def test_bind_step(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=Err("failed"))
+    step = Step(foo, 2)
+
+    assert Ok(1).bind_step(step) == Err("failed")
+    assert Err("200").bind_step(step) == Err("200")
+    foo.assert_called_once_with(1, 2)
+
+
+def test_map_err(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value="mapped")
+
+    ok = Ok(200)
+    err = Err("200")
+
+    assert ok.map_err(foo) is ok
+    assert err.map_err(foo) == Err("mapped")
+    foo.assert_called_once_with("200")
+
+
+def test_bind_err(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=Ok(1))
+
+    ok = Ok(200)
+    err = Err("200")
+
+    assert ok.bind_err(foo) is ok
+    assert ok.or_else(foo) is ok
+    assert err.bind_err(foo) == Ok(1)
+    assert err.or_else(lambda e: Err(e + "!")) == Err("200!")
+    foo.assert_called_once_with("200")
+
+
+def test_or_else_failover() -> None:
+    def cache(key: str) -> Result[str, str]:
+        return Err("cache miss")
+
+    def replica(key: str) -> Result[str, str]:
+        return Err("replica down")
+
+    def primary(key: str) -> Result[str, str]:
+        return Ok(key.upper())
+
+    res = (
+        cache("k")
+        .or_else(lambda _: replica("k"))
+        .or_else(lambda _: primary("k"))
+        .or_else(lambda _: replica("k"))
+    )
+
+    assert res == Ok("K")
+
+
+def test_recover(mocker: MockerFixture) -> None:
+    foo = mocker.MagicMock(return_value=0)
+
+    ok = Ok(200)
+    err = Err("200")
+
+    assert ok.recover(foo) is ok
+    assert ok.recover_with(0) is ok
+    assert err.recover(foo) == Ok(0)
+    assert err.recover_with(1) == Ok(1)
+    foo.assert_called_once_with("200")
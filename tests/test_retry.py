@@ -0,0 +1,113 @@
+import asyncio
+import random
+from typing import Callable
+
+import pytest
+
+from pyferret.result import Err, Ok, Result
+from pyferret.retry import RetriedErr, RetryBudget, RetryPolicy, retry
+
+
+def make(
+    results: list[Result[int, str]],
+) -> tuple[Callable[[int], Result[int, str]], list[int]]:
+    calls: list[int] = []
+
+    def func(n: int) -> Result[int, str]:
+        calls.append(n)
+        return results[len(calls) - 1]
+
+    return func, calls
+
+
+def test_retry_until_ok() -> None:
+    func, calls = make([Err("timeout"), Err("timeout"), Ok(1)])
+    res = retry(RetryPolicy(3, base_delay=0))(func)(7)
+
+    assert res == Ok(1)
+    assert calls == [7, 7, 7]
+
+
+def test_retried_err_history() -> None:
+    func, calls = make([Err("timeout"), Err("reset"), Err("timeout")])
+    res = retry(RetryPolicy(3, base_delay=0))(func)(1)
+
+    assert isinstance(res, RetriedErr)
+    assert res.attempts == 3
+    assert res.history == ["timeout", "reset", "timeout"]
+    assert res == Err("timeout")
+    assert Err("timeout") == res
+    assert hash(res) == hash(Err("timeout"))
+
+
+def test_predicate() -> None:
+    func, calls = make([Err("timeout"), Err("invalid"), Ok(1)])
+    res = retry(RetryPolicy(5, base_delay=0, predicate=lambda e: e == "timeout"))(func)(
+        1
+    )
+
+    assert isinstance(res, RetriedErr)
+    assert res.history == ["timeout", "invalid"]
+    assert len(calls) == 2
+
+    func, calls = make([Err("invalid")])
+    res = retry(RetryPolicy(5, predicate=lambda e: e == "timeout"))(func)(1)
+
+    assert isinstance(res, RetriedErr)
+    assert res.attempts == 1
+    assert res.history == ["invalid"]
+    assert not res.budget_exhausted
+
+
+def test_full_jitter_delay() -> None:
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(0))
+    delays = [policy.delay(n) for n in range(10) for _ in range(100)]
+
+    assert all(0.0 <= d <= 5.0 for d in delays)
+    assert all(d <= 2.0 for d in delays[100:200])
+    assert max(delays[900:]) > 4.0
+
+    with pytest.raises(ValueError):
+        RetryPolicy(0)
+
+
+def test_budget() -> None:
+    now = [0.0]
+    budget = RetryBudget(0.5, min_per_second=1.0, capacity=2.0, clock=lambda: now[0])
+    policy = RetryPolicy(10, base_delay=0, budget=budget)
+
+    func, calls = make([Err("timeout")] * 10)
+    res = retry(policy)(func)(1)
+
+    # 2 tokens of capacity, deposit on call is capped
+    assert res.attempts == 3
+    assert res.budget_exhausted
+    assert budget.rejected == 1
+    assert budget.balance == 0.0
+
+    now[0] = 1.5
+    assert budget.balance == 1.5
+
+    func, calls = make([Err("timeout")] * 10)
+    assert retry(policy)(func)(1).attempts == 3
+
+    # Out of attempts is not reported as budget exhaustion
+    now[0] = 10.0
+    func, calls = make([Err("timeout")] * 2)
+    res = retry(RetryPolicy(2, base_delay=0, budget=budget))(func)(1)
+
+    assert res.attempts == 2
+    assert not res.budget_exhausted
+
+
+def test_async_retry() -> None:
+    results = [Err("timeout"), Ok(1)]
+
+    async def func() -> Result[int, str]:
+        await asyncio.sleep(0)
+        return results.pop(0)
+
+    wrapped = retry(RetryPolicy(3, base_delay=0.001))(func)
+
+    assert asyncio.iscoroutinefunction(wrapped)
+    assert asyncio.run(wrapped()) == Ok(1)
@@ -0,0 +1,50 @@
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err, Ok, Result
+from pyferret.step import Step
+
+
+def collect(value: int, *args: int, **kwargs: int) -> tuple[object, ...]:
+    return (value, args, kwargs)
+
+
+def test_call_forms() -> None:
+    assert Step(collect)(1) == (1, (), {})
+    assert Step(collect, 2)(1) == (1, (2,), {})
+    assert Step(collect, 2, 3)(1) == (1, (2, 3), {})
+    assert Step(collect, 2, 3, 4)(1) == (1, (2, 3, 4), {})
+    assert Step(collect, a=5)(1) == (1, (), {"a": 5})
+    assert Step(collect, 2, a=5)(1) == (1, (2,), {"a": 5})
+
+
+def test_no_arguments_calls_function_directly() -> None:
+    assert Step(collect).call is collect
+
+
+def test_with_contexts() -> None:
+    step = Step(lambda x, y: x * y, 3)
+
+    assert Just(2).fmap(step) == Just(6)
+    assert Ok(2).fmap(step) == Ok(6)
+    assert Just(2).fmap_step(step) == Just(6)
+    assert Ok(2).fmap_step(step) == Ok(6)
+
+
+def test_repr() -> None:
+    assert repr(Step(collect, 2, a="x")) == "Step collect(_, 2, a='x')"
+    assert repr(Step(collect)) == "Step collect(_)"
+
+
+def test_bind_step() -> None:
+    def limit(x: int, top: int) -> Result[int, str]:
+        return Ok(x) if x <= top else Err("too big")
+
+    def lookup(x: int, table: dict[int, str]) -> Maybe[str]:
+        return Just(table[x]) if x in table else Nothing()
+
+    within = Step(limit, top=10)
+    known = Step(lookup, {1: "one"})
+
+    assert Ok(5).bind_step(within) == Ok(5)
+    assert Ok(50).bind_step(within) == Err("too big")
+    assert Just(1).bind_step(known) == Just("one")
+    assert Just(2).bind_step(known) == Nothing()
@@ -0,0 +1,183 @@
+import asyncio
+from typing import AsyncIterator, TypeVar
+
+import pytest
+
+from pyferret.result import Err, Ok, Result
+from pyferret.stream import (
+    ResultStats,
+    abind_result,
+    achunked,
+    aiter_ok,
+    amap_result,
+    apartition,
+    partition_results,
+)
+
+T = TypeVar("T")
+
+RESULTS: list[Result[int, object]] = [
+    Ok(1),
+    Err("timeout"),
+    Ok(2),
+    Err(ValueError("bad")),
+    Err("timeout"),
+    Err(["unhashable"]),
+]
+
+
+def test_partition_results() -> None:
+    oks, errs = partition_results(iter(RESULTS))
+
+    assert oks == [1, 2]
+    assert errs[0] == "timeout"
+    assert len(errs) == 4
+    assert partition_results([]) == ([], [])
+
+
+def test_result_stats() -> None:
+    stats = ResultStats().update(RESULTS)
+
+    assert stats.total == 6
+    assert stats.ok_count == 2
+    assert stats.err_count == 4
+    assert stats.error_rate == 4 / 6
+    assert stats.errors_by_kind == {"timeout": 2, "ValueError": 1, "list": 1}
+    assert stats.samples == [r for r in RESULTS if isinstance(r, Err)]
+    assert repr(stats).startswith("ResultStats total=6 ok=2 err=4")
+    assert stats.to_dict()["errors_by_kind"] == {
+        "timeout": 2,
+        "ValueError": 1,
+        "list": 1,
+    }
+
+
+def test_result_stats_empty() -> None:
+    assert ResultStats().error_rate == 0.0
+
+
+def test_result_stats_reservoir() -> None:
+    stats = ResultStats(sample_size=5, seed=1)
+
+    stats.update(Err(n) if n % 2 else Ok(n) for n in range(10_000))
+
+    assert len(stats.samples) == 5
+    assert len(set(stats.samples)) == 5
+    assert all(isinstance(s, Err) and s.err_value % 2 for s in stats.samples)
+    assert max(s.err_value for s in stats.samples) > 100
+
+
+def test_result_stats_observe() -> None:
+    stats = ResultStats()
+
+    assert list(stats.observe(RESULTS)) == RESULTS
+    assert stats.total == 6
+
+
+async def source(items: list[Result[int, str]]) -> AsyncIterator[Result[int, str]]:
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def collect(stream: AsyncIterator[T]) -> list[T]:
+    return [item async for item in stream]
+
+
+ITEMS: list[Result[int, str]] = [Ok(3), Err("a"), Ok(1), Ok(2), Err("b")]
+
+
+def test_amap_result_ordered() -> None:
+    async def double(x: int) -> int:
+        await asyncio.sleep(x / 100)
+        return x * 2
+
+    results = asyncio.run(collect(amap_result(source(ITEMS), double, concurrency=3)))
+
+    assert results == [Ok(6), Err("a"), Ok(2), Ok(4), Err("b")]
+
+
+def test_abind_result_completion_order() -> None:
+    async def check(x: int) -> Result[int, str]:
+        await asyncio.sleep(x / 100)
+        return Ok(x) if x > 1 else Err("small")
+
+    results = asyncio.run(
+        collect(abind_result(source(ITEMS), check, concurrency=5, ordered=False))
+    )
+
+    assert results == [Err("a"), Err("b"), Err("small"), Ok(2), Ok(3)]
+
+
+def test_concurrency_limit() -> None:
+    running = 0
+    peak = 0
+
+    async def track(x: int) -> Result[int, str]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return Ok(x)
+
+    items: list[Result[int, str]] = [Ok(n) for n in range(50)]
+
+    for ordered in (True, False):
+        peak = 0
+        results = asyncio.run(
+            collect(abind_result(source(items), track, concurrency=4, ordered=ordered))
+        )
+
+        assert peak == 4
+        assert sorted(r.ok_value for r in results) == list(range(50))
+
+
+def test_stop_on_err_cancels_pending() -> None:
+    started: list[int] = []
+    finished: list[int] = []
+
+    async def slow(x: int) -> Result[int, str]:
+        started.append(x)
+        await asyncio.sleep(0.05)
+        finished.append(x)
+        return Ok(x)
+
+    async def main() -> list[Result[int, str]]:
+        stream = abind_result(
+            source([Ok(1), Err("stop"), Ok(2), Ok(3)]),
+            slow,
+            concurrency=4,
+            ordered=False,
+            stop_on_err=True,
+        )
+        results = await collect(stream)
+        await asyncio.sleep(0.1)
+
+        return results
+
+    assert asyncio.run(main()) == [Err("stop")]
+    assert started == [1, 2, 3]
+    assert finished == []
+
+
+def test_invalid_concurrency() -> None:
+    async def identity(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(amap_result(source(ITEMS), identity, concurrency=0)))
+
+
+def test_aiter_ok_and_apartition() -> None:
+    assert asyncio.run(collect(aiter_ok(source(ITEMS)))) == [3, 1, 2]
+    assert asyncio.run(apartition(source(ITEMS))) == ([3, 1, 2], ["a", "b"])
+
+
+def test_achunked() -> None:
+    chunks = asyncio.run(collect(achunked(source(ITEMS), 2)))
+
+    assert chunks == [ITEMS[:2], ITEMS[2:4], ITEMS[4:]]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(achunked(source(ITEMS), 0)))
@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pyferret.circuit import CircuitBreaker
+from pyferret.executor import BoundedExecutor
+from pyferret.maybe import Just, Maybe, Nothing
+from pyferret.result import Err, Ok, Result
+
+THREADS = 8
+OPS = 2_000
+
+
+def run_threads(target: object) -> None:
+    barrier = threading.Barrier(THREADS)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        target(n)  # type: ignore[operator]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(worker, range(THREADS)))
+
+
+def test_shared_instances_are_not_mutated() -> None:
+    ok, err, just, nothing = Ok(1), Err("e"), Just(1), Nothing()
+    failures: list[int] = []
+
+    def half(x: int) -> Result[int, str]:
+        return Ok(x // 2) if x % 2 else Err("even")
+
+    def lookup(x: int) -> Maybe[int]:
+        return Just(x) if x % 3 else Nothing()
+
+    def target(n: int) -> None:
+        for i in range(OPS):
+            value = n * OPS + i
+
+            if ok.fmap(lambda x, v=value: x + v).bind(half) != half(value + 1):
+                failures.append(value)
+
+            if just.fmap(lambda x, v=value: x + v).bind(lookup) != lookup(value + 1):
+                failures.append(value)
+
+            if err.fmap(abs) is not err or nothing.bind(lookup) is not nothing:
+                failures.append(value)
+
+    run_threads(target)
+
+    assert failures == []
+    assert (ok, err, just, nothing) == (Ok(1), Err("e"), Just(1), Nothing())
+
+
+def test_circuit_breaker_counters() -> None:
+    breaker = CircuitBreaker(
+        lambda x: Ok(x) if x % 2 else Err(x), failure_threshold=OPS, window=OPS
+    )
+
+    run_threads(lambda n: [breaker(i) for i in range(OPS)])
+
+    assert breaker.calls + breaker.rejections == THREADS * OPS
+    assert breaker.calls == breaker.successes + breaker.failures
+    assert breaker.window_failures <= OPS
+
+
+def test_executor_with_many_producers() -> None:
+    executor = BoundedExecutor[int, str](4, max_per_key=2)
+    results: list[Result[int, str]] = []
+    consumer = threading.Thread(target=lambda: results.extend(executor.results()))
+    consumer.start()
+
+    run_threads(
+        lambda n: [executor.submit(lambda i=i: Ok(i), key=n % 3) for i in range(100)]
+    )
+
+    executor.close()
+    consumer.join()
+
+    assert len(results) == THREADS * 100
+    assert executor.in_flight == 0